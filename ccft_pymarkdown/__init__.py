@@ -1,18 +1,59 @@
 """Suppress custom-formatted table errors when linting using PyMarkdown in Markdown files."""
 
+import importlib
 from typing import TYPE_CHECKING
 
-from ._clean import clean
-from ._restore import restore
-from .console import run
-from .context_manager import CleanCustomFormattedTables
-
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+    from ._clean import clean, clean_string, iter_clean
+    from ._clean_index import CleanIndex
+    from ._mirror import mirror_clean
+    from ._path_filter import PathFilter
+    from ._pipeline import pipelined_clean
+    from ._restore import restore
+    from .console import run
+    from .context_manager import CleanCustomFormattedTables
 
 __all__: "Sequence[str]" = (
     "CleanCustomFormattedTables",
+    "CleanIndex",
+    "PathFilter",
     "clean",
+    "clean_string",
+    "iter_clean",
+    "mirror_clean",
+    "pipelined_clean",
     "restore",
     "run",
 )
+
+# NOTE: Each public name is only imported from its submodule when first accessed, so that importing this package stays fast & never imports the command-line dependencies unless they are used
+_LAZY_ATTRIBUTE_MODULES: "Final[Mapping[str, str]]" = {
+    "CleanCustomFormattedTables": ".context_manager",
+    "CleanIndex": "._clean_index",
+    "PathFilter": "._path_filter",
+    "clean": "._clean",
+    "clean_string": "._clean",
+    "iter_clean": "._clean",
+    "mirror_clean": "._mirror",
+    "pipelined_clean": "._pipeline",
+    "restore": "._restore",
+    "run": ".console",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name: str | None = _LAZY_ATTRIBUTE_MODULES.get(name)
+    if module_name is None:
+        NO_ATTRIBUTE_MESSAGE: Final[str] = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(NO_ATTRIBUTE_MESSAGE)
+
+    attribute: object = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> "Sequence[str]":
+    return sorted({*globals(), *__all__})
@@ -1,62 +1,120 @@
 """Perform the cleaning of custom-formatted tables from Markdown files."""
 
+import contextlib
 import logging
 import shutil
-from pathlib import Path
 from typing import TYPE_CHECKING
 
+from . import _ownership as ownership
 from . import utils
-from .utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod
+from ._restore import restore
+from ._verify import hash_contents, hash_file
+from .utils import (
+    CONVERSION_FILE_SUFFIX,
+    HOLDERS_FILE_SUFFIX,
+    LOCK_FILE_SUFFIX,
+    FileExclusionMethod,
+    metrics,
+)
+from .utils.metrics import MetricsCounter
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Iterator, MutableMapping, Sequence
     from collections.abc import Set as AbstractSet
     from logging import Logger
-    from typing import Final, Literal, TextIO
+    from pathlib import Path
+    from typing import Final, TextIO
 
+    from ._clean_index import CleanIndex
+    from ._path_filter import PathFilter
 
-__all__: "Sequence[str]" = ("clean",)
+
+__all__: "Sequence[str]" = ("clean", "clean_string", "iter_clean")
 
 logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
 
 
-def _copy_file(original_file_path: "Path") -> tuple["Path", "Path"]:
-    copied_path: Path = Path(
-        shutil.copy2(
-            original_file_path,
-            original_file_path.parent / f"{original_file_path.name}{CONVERSION_FILE_SUFFIX}",
+def _copy_file(
+    original_file_path: "Path", *, hash_original: bool
+) -> tuple["Path", str | None]:
+    copied_path: Path = (
+        original_file_path.parent / f"{original_file_path.name}{CONVERSION_FILE_SUFFIX}"
+    )
+
+    if not hash_original:
+        shutil.copy2(original_file_path, copied_path)
+        return copied_path, None
+
+    # NOTE: The original contents are hashed as they are copied (rather than from the saved copy), so that a bad copy is caught when the restored file is verified
+    original_contents: bytes = original_file_path.read_bytes()
+    copied_path.write_bytes(original_contents)
+    shutil.copystat(original_file_path, copied_path)
+    return copied_path, hash_contents(original_contents)
+
+
+def clean_string(markdown: str) -> str:
+    """Clean custom-formatted tables within the given Markdown content."""
+    return (
+        markdown.replace(
+            "<br>* ",
+            "<br> ",
+        )
+        .replace(
+            "<br/>* ",
+            "<br/> ",
+        )
+        .replace(
+            "| * ",
+            "| ",
         )
     )
-    return copied_path, original_file_path
 
 
-def _clean_single_file(original_file_path: "Path") -> None:
-    """Clean custom-formatted tables within a Markdown file at a given path."""
+def _clean_single_file(
+    original_file_path: "Path", *, hash_original: bool = False
+) -> str | None:
+    """
+    Clean custom-formatted tables within a Markdown file at a given path.
+
+    If requested, returns the hash of the file's original contents.
+    """
     new_file_path: Path
-    new_file_path, original_file_path = _copy_file(original_file_path)
+    original_hash: str | None
+    new_file_path, original_hash = _copy_file(original_file_path, hash_original=hash_original)
+
+    lines_modified: int = 0
 
     original_file: TextIO
     new_file: TextIO
-    with original_file_path.open("w") as original_file, new_file_path.open("r") as new_file:
-        line: str
-        for line in new_file:
-            original_file.write(
-                line.replace(
-                    "<br>* ",
-                    "<br> ",
-                )
-                .replace(
-                    "<br/>* ",
-                    "<br/> ",
-                )
-                .replace(
-                    "| * ",
-                    "| ",
-                ),
-            )
+    try:
+        with (
+            original_file_path.open("w") as original_file,
+            new_file_path.open("r") as new_file,
+        ):
+            line: str
+            for line in new_file:
+                cleaned_line: str = clean_string(line)
+                lines_modified += cleaned_line != line
+                original_file.write(cleaned_line)
+    except BaseException:
+        # NOTE: A partially written file is replaced by its saved copy, so a failed write never leaves a truncated file behind
+        new_file_path.replace(original_file_path)
+        raise
 
+    # NOTE: The original file is read twice (once when copied & once when cleaned), and written twice (once as the copy & once cleaned)
+    ORIGINAL_FILE_SIZE: Final[int] = new_file_path.stat().st_size
+    metrics.increment_metric(MetricsCounter.BYTES_READ, 2 * ORIGINAL_FILE_SIZE)
+    metrics.increment_metric(
+        MetricsCounter.BYTES_WRITTEN, ORIGINAL_FILE_SIZE + original_file_path.stat().st_size
+    )
+    metrics.increment_metric(MetricsCounter.LINES_MODIFIED, lines_modified)
 
-def _check_file(file_path: "Path") -> "Literal[True]":
+    return original_hash
+
+
+def _check_file(
+    file_path: "Path", live_holders: "Sequence[str]", owner_id: str | None
+) -> bool:
     logger.debug("Checking file '%s'", file_path)
 
     if file_path.suffix != ".md":
@@ -66,6 +124,16 @@ def _check_file(file_path: "Path") -> "Literal[True]":
     if not file_path.is_file():
         raise FileNotFoundError
 
+    if live_holders:
+        if owner_id is None:
+            FILE_IN_USE_MESSAGE: Final[str] = (
+                "Cannot clean custom-formatted tables from Markdown files: "
+                f"'{file_path}' is currently in use by another running process."
+            )
+            raise FileExistsError(FILE_IN_USE_MESSAGE)
+
+        return True
+
     original_file_path: Path = file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
     if original_file_path.exists():
         ORIGINAL_FILE_ALREADY_EXISTS_MESSAGE: str = (
@@ -74,63 +142,333 @@ def _check_file(file_path: "Path") -> "Literal[True]":
         )
         raise FileExistsError(ORIGINAL_FILE_ALREADY_EXISTS_MESSAGE)
 
-    return True
+    return False
 
 
-def clean(
+def _iter_clean(
     files: "Iterable[Path]",
-    file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
+    file_exclusion_method: FileExclusionMethod,
+    processed_files: set["Path"],
     *,
-    skip_errors: bool = False,
-    dry_run: bool = False,
-) -> "AbstractSet[Path]":
-    """Clean custom-formatted tables within each given Markdown file."""
-    cleaned_files: set[Path] = set()
-
+    skip_errors: bool,
+    dry_run: bool,
+    owner_id: str | None,
+    path_filter: "PathFilter | None",
+    original_hashes: "MutableMapping[Path, str] | None",
+) -> "Iterator[Path]":
     file_path: Path
     for file_path in files:
-        if file_path in cleaned_files:
+        if file_path in processed_files:
             logger.debug("Skipping file '%s': already processed", file_path)
             continue
 
         if file_path.is_dir():
             logger.debug("Recursing into directory '%s'", file_path)
-            cleaned_files.update(
-                clean(
-                    utils.get_markdown_files(file_path, file_exclusion_method),
-                    file_exclusion_method,
-                    skip_errors=skip_errors,
-                    dry_run=dry_run,
-                )
+            yield from _iter_clean(
+                utils.get_markdown_files(file_path, file_exclusion_method, path_filter),
+                file_exclusion_method,
+                processed_files,
+                skip_errors=skip_errors,
+                dry_run=dry_run,
+                owner_id=owner_id,
+                path_filter=path_filter,
+                original_hashes=original_hashes,
             )
             continue
 
-        try:
-            _check_file(file_path)
-        except (FileNotFoundError, FileExistsError, OSError) as e:
-            if not skip_errors:
-                raise e from e
+        metrics.increment_metric(MetricsCounter.FILES_DISCOVERED)
+
+        file_lock_stack: contextlib.ExitStack[bool | None]
+        with metrics.time_phase("clean"), contextlib.ExitStack() as file_lock_stack:
+            try:
+                if not dry_run:
+                    file_lock_stack.enter_context(ownership.lock_file(file_path))
+
+                live_holders: Sequence[str] = ownership.get_live_holders(file_path)
+                is_shared: bool = _check_file(file_path, live_holders, owner_id)
+            except (FileNotFoundError, FileExistsError, OSError) as e:
+                if not skip_errors:
+                    raise e from e
+
+                logger.error(  # noqa: TRY400
+                    "Skipping '%s': %s", file_path, utils.format_exception_to_log_message(e)
+                )
+                metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+                continue
+
+            logger.debug("File '%s' passed pre-cleaning checks", file_path)
+
+            if is_shared:
+                logger.debug(
+                    "File '%s' already cleaned by another running process, sharing file",
+                    file_path,
+                )
+                metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+
+            if not dry_run:
+                original_hash: str | None = None
+
+                if is_shared and original_hashes is not None:
+                    # NOTE: A shared file was cleaned by another running process, so only its saved original file can be hashed
+                    original_hash = hash_file(
+                        file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
+                    )
+
+                if not is_shared:
+                    try:
+                        original_hash = _clean_single_file(
+                            file_path, hash_original=original_hashes is not None
+                        )
+                    except (OSError, ValueError, RuntimeError, TypeError) as e:
+                        if not skip_errors:
+                            raise e from e
+
+                        logger.error(  # noqa: TRY400
+                            "Error while cleaning '%s': %s",
+                            file_path,
+                            utils.format_exception_to_log_message(e),
+                        )
+                        metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+                        continue
+
+                    metrics.increment_metric(MetricsCounter.FILES_CLEANED)
+
+                if owner_id is not None:
+                    ownership.set_holders(file_path, [*live_holders, owner_id])
+
+                if original_hashes is not None and original_hash is not None:
+                    original_hashes[file_path] = original_hash
+
+        processed_files.add(file_path)
+
+        logger.debug("Successfully cleaned file: '%s'", file_path)
+
+        yield file_path
+
+
+def iter_clean(
+    files: "Iterable[Path]",
+    file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
+    *,
+    skip_errors: bool = False,
+    dry_run: bool = False,
+    owner_id: str | None = None,
+    path_filter: "PathFilter | None" = None,
+    original_hashes: "MutableMapping[Path, str] | None" = None,
+) -> "Iterator[Path]":
+    """
+    Clean custom-formatted tables within each given Markdown file, one file at a time.
 
-            logger.error(  # noqa: TRY400
-                "Skipping '%s': %s", file_path, utils.format_exception_to_log_message(e)
+    Each file is yielded as soon as it has been cleaned,
+    so that it can be used before the remaining files have been cleaned.
+    If an owner ID is given, the files are held by that owner until they are restored,
+    and any files already held by another running process are shared (not cleaned again).
+    Any given path filter only applies to the files found when recursing directories.
+    If a mapping of original hashes is given, the hash of each cleaned file's original
+    contents is stored within it, to verify the file once restored.
+    """
+    return _iter_clean(
+        files,
+        file_exclusion_method,
+        set(),
+        skip_errors=skip_errors,
+        dry_run=dry_run,
+        owner_id=owner_id,
+        path_filter=path_filter,
+        original_hashes=original_hashes,
+    )
+
+
+def _iter_files_to_clean(
+    files: "Iterable[Path]",
+    file_exclusion_method: FileExclusionMethod,
+    path_filter: "PathFilter | None",
+) -> "Iterator[Path]":
+    file_path: Path
+    for file_path in files:
+        if file_path.is_dir():
+            yield from _iter_files_to_clean(
+                utils.get_markdown_files(file_path, file_exclusion_method, path_filter),
+                file_exclusion_method,
+                path_filter,
             )
             continue
 
-        logger.debug("File '%s' passed pre-cleaning checks", file_path)
+        yield file_path
+
+
+def _select_files_needing_cleaning(
+    files: "Iterable[Path]", clean_index: "CleanIndex", *, dry_run: bool
+) -> "Sequence[Path]":
+    files_needing_cleaning: list[Path] = []
+    unmodified_files_count: int = 0
+
+    with metrics.time_phase("clean"):
+        file_path: Path
+        for file_path in files:
+            if clean_index.needs_cleaning(file_path):
+                files_needing_cleaning.append(file_path)
+                continue
+
+            unmodified_files_count += 1
+            metrics.increment_metric(MetricsCounter.FILES_DISCOVERED)
+            metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
 
         if not dry_run:
+            clean_index.save()
+
+    logger.debug(
+        "Skipping cleaning %d files that contain no custom-formatted tables",
+        unmodified_files_count,
+    )
+    return files_needing_cleaning
+
+
+def _is_leftover_original_file(file_path: "Path", *, dry_run: bool) -> bool:
+    """Check, while holding its lock, whether the given file's saved original is unused."""
+    with ownership.lock_file(file_path) if not dry_run else contextlib.nullcontext():
+        return (
+            file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
+        ).exists() and not ownership.get_live_holders(file_path)
+
+
+def _preflight_check_files(files: "Sequence[Path]", *, dry_run: bool) -> None:
+    """
+    Check every given Markdown file can be cleaned, before any file is modified.
+
+    Each directory is only listed once, however many of the given files it contains.
+    """
+    directory_listings: dict[Path, AbstractSet[str]] = {}
+    existing_original_file_paths: list[Path] = []
+
+    file_path: Path
+    for file_path in files:
+        if file_path.suffix != ".md":
+            INVALID_FILE_SUFFIX_MESSAGE: str = (
+                f"Cannot clean custom-formatted tables from '{file_path}': "
+                "File is not a markdown file."
+            )
+            raise ValueError(INVALID_FILE_SUFFIX_MESSAGE)
+
+        directory_listing: AbstractSet[str] | None = directory_listings.get(file_path.parent)
+        if directory_listing is None:
             try:
-                _clean_single_file(file_path)
-            except (OSError, ValueError, RuntimeError, TypeError) as e:
-                logger.error(  # noqa: TRY400
-                    "Error while cleaning '%s': %s",
-                    file_path,
-                    utils.format_exception_to_log_message(e),
+                directory_listing = frozenset(
+                    child_path.name for child_path in file_path.parent.iterdir()
                 )
-                continue
+            except (FileNotFoundError, NotADirectoryError):
+                directory_listing = frozenset()
 
-        cleaned_files.add(file_path)
+            directory_listings[file_path.parent] = directory_listing
 
-        logger.debug("Successfully cleaned file: '%s'", file_path)
+        if file_path.name not in directory_listing:
+            FILE_NOT_FOUND_MESSAGE: str = (
+                f"Cannot clean custom-formatted tables from '{file_path}': "
+                "File does not exist."
+            )
+            raise FileNotFoundError(FILE_NOT_FOUND_MESSAGE)
+
+        # NOTE: A file that is being cleaned, or is held, by other running processes may already have a saved original file, so whether it can be shared is only checked while cleaning (when its lock is held)
+        if (
+            f"{file_path.name}{CONVERSION_FILE_SUFFIX}" in directory_listing
+            and f"{file_path.name}{LOCK_FILE_SUFFIX}" not in directory_listing
+            and f"{file_path.name}{HOLDERS_FILE_SUFFIX}" not in directory_listing
+            and _is_leftover_original_file(file_path, dry_run=dry_run)
+        ):
+            existing_original_file_paths.append(
+                file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
+            )
+
+    if not existing_original_file_paths:
+        return
+
+    existing_original_file_path: Path
+    for existing_original_file_path in existing_original_file_paths:
+        logger.debug("Original file '%s' already exists", existing_original_file_path)
+
+    ORIGINAL_FILES_ALREADY_EXIST_MESSAGE: Final[str] = (
+        "Cannot clean custom-formatted tables from Markdown files: "
+        f"'{existing_original_file_paths[0]}' already exists"
+        + (
+            f" (along with {len(existing_original_file_paths) - 1} other original files)."
+            if len(existing_original_file_paths) > 1
+            else "."
+        )
+    )
+    raise FileExistsError(ORIGINAL_FILES_ALREADY_EXIST_MESSAGE)
+
+
+def clean(
+    files: "Iterable[Path]",
+    file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
+    *,
+    skip_errors: bool = False,
+    dry_run: bool = False,
+    owner_id: str | None = None,
+    path_filter: "PathFilter | None" = None,
+    clean_index: "CleanIndex | None" = None,
+    original_hashes: "MutableMapping[Path, str] | None" = None,
+) -> "AbstractSet[Path]":
+    """
+    Clean custom-formatted tables within each given Markdown file.
+
+    Unless errors are skipped, every file is checked before any file is modified,
+    and if cleaning any file fails, all the files already cleaned by this call are restored.
+    If a clean index is given, files that contain no custom-formatted tables are skipped
+    (without being modified, nor returned), and unchanged files are classified without
+    being read.
+    If a mapping of original hashes is given, the hash of each cleaned file's original
+    contents is stored within it, to verify the file once restored.
+    """
+    if clean_index is not None:
+        files = _select_files_needing_cleaning(
+            _iter_files_to_clean(files, file_exclusion_method, path_filter),
+            clean_index,
+            dry_run=dry_run,
+        )
+
+    if skip_errors:
+        return set(
+            iter_clean(
+                files,
+                file_exclusion_method,
+                skip_errors=skip_errors,
+                dry_run=dry_run,
+                owner_id=owner_id,
+                path_filter=path_filter,
+                original_hashes=original_hashes,
+            )
+        )
+
+    files_to_clean: Sequence[Path] = list(
+        dict.fromkeys(_iter_files_to_clean(files, file_exclusion_method, path_filter))
+    )
+    with metrics.time_phase("clean"):
+        _preflight_check_files(files_to_clean, dry_run=dry_run)
+
+    cleaned_files: set[Path] = set()
+    try:
+        file_path: Path
+        for file_path in iter_clean(
+            files_to_clean,
+            file_exclusion_method,
+            dry_run=dry_run,
+            owner_id=owner_id,
+            path_filter=path_filter,
+            original_hashes=original_hashes,
+        ):
+            cleaned_files.add(file_path)
+    except BaseException:
+        if not dry_run and cleaned_files:
+            logger.debug("Cleaning failed, restoring %s cleaned files", len(cleaned_files))
+            restore(
+                (
+                    cleaned_file_path.parent
+                    / f"{cleaned_file_path.name}{CONVERSION_FILE_SUFFIX}"
+                    for cleaned_file_path in cleaned_files
+                ),
+                owner_id=owner_id,
+            )
+        raise
 
     return cleaned_files
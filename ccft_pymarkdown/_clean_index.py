@@ -0,0 +1,142 @@
+"""Record which Markdown files need cleaning, so unchanged files are never read again."""
+
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+from . import utils
+from ._clean import clean_string
+from .utils import CONVERSION_FILE_SUFFIX, metrics
+from .utils.metrics import MetricsCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final, TextIO
+
+
+__all__: "Sequence[str]" = ("CleanIndex",)
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+_INDEX_VERSION: "Final[int]" = 1
+
+# NOTE: A file modified within the same tick of a coarse filesystem clock as it was checked could change without its modification time changing, so recently modified files are never recorded
+_RECENTLY_MODIFIED_WINDOW_NS: "Final[int]" = 2_000_000_000
+
+
+class CleanIndex:
+    """
+    Record of whether each Markdown file needs cleaning, keyed by its modification time & size.
+
+    Files whose modification time & size are unchanged since they were last checked
+    are classified without being read.
+    If an index file is given, the record is loaded from & saved to that file,
+    so it persists between runs.
+    """
+
+    def __init__(self, index_file_path: "Path | None" = None) -> None:
+        """Load the record of previously checked files from the given index file."""
+        self.index_file_path: Path | None = index_file_path
+        self._entries: dict[str, tuple[int, int, bool]] = (
+            self._load(index_file_path) if index_file_path is not None else {}
+        )
+        self._is_modified: bool = False
+
+    @classmethod
+    def _load(cls, index_file_path: "Path") -> dict[str, tuple[int, int, bool]]:
+        index_file: TextIO
+        try:
+            with index_file_path.open("r") as index_file:
+                raw_index: object = json.load(index_file)
+        except FileNotFoundError:
+            logger.debug("Index file '%s' does not exist, checking all files", index_file_path)
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Ignoring unreadable index file '%s': %s",
+                index_file_path,
+                utils.format_exception_to_log_message(e),
+            )
+            return {}
+
+        if (
+            not isinstance(raw_index, dict)
+            or raw_index.get("version") != _INDEX_VERSION
+            or not isinstance(raw_index.get("files"), dict)
+        ):
+            logger.warning("Ignoring index file '%s' in an unknown format", index_file_path)
+            return {}
+
+        return {
+            str(raw_file_key): (raw_entry[0], raw_entry[1], raw_entry[2])
+            for raw_file_key, raw_entry in raw_index["files"].items()
+            if isinstance(raw_entry, list)
+            and len(raw_entry) == 3
+            and isinstance(raw_entry[0], int)
+            and isinstance(raw_entry[1], int)
+            and isinstance(raw_entry[2], bool)
+        }
+
+    def needs_cleaning(self, file_path: "Path") -> bool:
+        """
+        Check whether the given Markdown file contains any custom-formatted tables.
+
+        Files that cannot be checked are assumed to need cleaning,
+        so that any errors are reported when they are cleaned.
+        """
+        if file_path.suffix != ".md":
+            return True
+
+        # NOTE: A file that is currently cleaned by another running process must still be cleaned, so that it is held until this run restores it
+        if file_path.with_name(f"{file_path.name}{CONVERSION_FILE_SUFFIX}").exists():
+            return True
+
+        try:
+            file_stat: os.stat_result = file_path.stat()
+        except OSError:
+            return True
+
+        file_key: str = os.fspath(file_path.absolute())
+        entry: tuple[int, int, bool] | None = self._entries.get(file_key)
+        if entry is not None and entry[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return entry[2]
+
+        try:
+            markdown: str = file_path.read_text()
+        except (OSError, UnicodeDecodeError):
+            return True
+
+        metrics.increment_metric(MetricsCounter.BYTES_READ, file_stat.st_size)
+
+        needs_cleaning: bool = clean_string(markdown) != markdown
+
+        if time.time_ns() - file_stat.st_mtime_ns > _RECENTLY_MODIFIED_WINDOW_NS:
+            self._entries[file_key] = (
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+                needs_cleaning,
+            )
+            self._is_modified = True
+
+        return needs_cleaning
+
+    def save(self) -> None:
+        """Store the record of checked files, if it has changed since it was loaded."""
+        if self.index_file_path is None or not self._is_modified:
+            return
+
+        # NOTE: The index is written to a temporary file then moved into place, so that concurrent runs never read a partially written index
+        temporary_index_file_path: Path = self.index_file_path.with_name(
+            f"{self.index_file_path.name}.{os.getpid()}.tmp"
+        )
+
+        index_file: TextIO
+        with temporary_index_file_path.open("w") as index_file:
+            json.dump({"version": _INDEX_VERSION, "files": self._entries}, index_file)
+
+        temporary_index_file_path.replace(self.index_file_path)
+        self._is_modified = False
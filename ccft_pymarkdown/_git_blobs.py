@@ -0,0 +1,166 @@
+"""Read the contents of Markdown files directly from a git repository's object database."""
+
+import logging
+import stat
+from typing import TYPE_CHECKING
+
+from . import utils
+from .utils import metrics
+from .utils.metrics import MetricsCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final
+
+    from ._path_filter import PathFilter
+
+
+__all__: "Sequence[str]" = ("GitBlobReader",)
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+
+class GitBlobReader:
+    """
+    Reader of the staged (or committed) contents of Markdown files within a git repository.
+
+    Contents are read through a single long-lived git process,
+    so the working tree is never read from or modified.
+    """
+
+    def __init__(
+        self,
+        rev: str | None = None,
+        root: "Path | None" = None,
+        *,
+        path_filter: "PathFilter | None" = None,
+    ) -> None:
+        """
+        Initialise the reader for the Markdown files within the given revision.
+
+        If no revision is given, the currently staged contents (within the index) will be read.
+        Only files selected by the given path filter are read.
+        """
+        from git import InvalidGitRepositoryError, NoSuchPathError, Repo  # noqa: PLC0415
+        from git.exc import ODBError  # noqa: PLC0415
+
+        self.rev: str | None = rev
+        self.root: Path = root if root is not None else utils.get_project_root()
+        self.path_filter: PathFilter | None = path_filter
+
+        # NOTE: Listed paths are resolved before being looked up, so the project root must be resolved too, in case it is reached through a symlink
+        self._resolved_root: Path = self.root.resolve()
+
+        try:
+            self._repo: Repo = Repo(self.root)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            NOT_GIT_REPOSITORY_MESSAGE: Final[str] = (
+                f"Cannot read files from git: '{self.root}' is not a git repository."
+            )
+            raise ValueError(NOT_GIT_REPOSITORY_MESSAGE) from None
+
+        try:
+            self._blob_ids: Mapping[Path, bytes] = self._get_markdown_blob_ids()
+        except (ODBError, ValueError):
+            INVALID_REV_MESSAGE: Final[str] = (
+                f"Cannot read files from git: '{rev}' is not a valid revision."
+            )
+            raise ValueError(INVALID_REV_MESSAGE) from None
+
+    def _get_markdown_blob_ids(self) -> "Mapping[Path, bytes]":
+        from git import Blob  # noqa: PLC0415
+
+        if self.rev is None:
+            logger.debug("Reading Markdown files from the git index of '%s'", self.root)
+            return {
+                file_path: index_entry.binsha
+                for (_, stage), index_entry in self._repo.index.entries.items()
+                if stage == 0
+                and stat.S_ISREG(index_entry.mode)
+                and (file_path := self.root / index_entry.path).suffix == ".md"
+                and (self.path_filter is None or self.path_filter.matches(file_path))
+            }
+
+        logger.debug(
+            "Reading Markdown files from git revision '%s' of '%s'", self.rev, self.root
+        )
+        return {
+            file_path: tree_object.binsha
+            for tree_object in self._repo.commit(self.rev).tree.traverse(
+                prune=self._is_excluded_tree
+            )
+            if isinstance(tree_object, Blob)
+            and stat.S_ISREG(tree_object.mode)
+            and (file_path := self.root / tree_object.path).suffix == ".md"
+            and (self.path_filter is None or self.path_filter.matches(file_path))
+        }
+
+    def _is_excluded_tree(self, tree_object: object, _depth: int) -> bool:
+        from git import Tree  # noqa: PLC0415
+
+        return (
+            self.path_filter is not None
+            and isinstance(tree_object, Tree)
+            and self.path_filter.is_excluded_directory(self.root / tree_object.path)
+        )
+
+    @property
+    def markdown_files(self) -> "Iterable[Path]":
+        """Retrieve the paths of all the Markdown files within the selected revision."""
+        return self._blob_ids.keys()
+
+    def _get_blob_file_path(self, file_path: "Path") -> "Path":
+        resolved_file_path: Path = file_path.resolve()
+
+        try:
+            return self.root / resolved_file_path.relative_to(self._resolved_root)
+        except ValueError:
+            return resolved_file_path
+
+    def read(self, file_path: "Path") -> str:
+        """Retrieve the contents of the given Markdown file, within the selected revision."""
+        try:
+            blob_id: bytes = self._blob_ids[self._get_blob_file_path(file_path)]
+        except KeyError:
+            raise FileNotFoundError(file_path) from None
+
+        raw_contents: bytes = self._repo.odb.stream(blob_id).read()
+        metrics.increment_metric(MetricsCounter.BYTES_READ, len(raw_contents))
+        return raw_contents.decode()
+
+    def iter_read(self, files: "Iterable[Path] | None" = None) -> "Iterator[tuple[Path, str]]":
+        """
+        Read the contents of each of the given Markdown files, skipping unreadable files.
+
+        Files listed more than once (possibly through differently written paths)
+        are only read the first time.
+        """
+        read_file_paths: set[Path] = set()
+
+        file_path: Path
+        for file_path in files if files is not None else self.markdown_files:
+            blob_file_path: Path = self._get_blob_file_path(file_path)
+            if blob_file_path in read_file_paths:
+                logger.debug("Skipping '%s': File has already been read", file_path)
+                continue
+
+            read_file_paths.add(blob_file_path)
+            metrics.increment_metric(MetricsCounter.FILES_DISCOVERED)
+
+            try:
+                yield file_path, self.read(file_path)
+            except (FileNotFoundError, UnicodeDecodeError) as e:
+                logger.error(  # noqa: TRY400
+                    "Skipping '%s': %s",
+                    file_path,
+                    "File is not valid UTF-8"
+                    if isinstance(e, UnicodeDecodeError)
+                    else "File does not exist within the selected revision",
+                )
+                metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+
+    def close(self) -> None:
+        """Stop the long-lived git process used to read file contents."""
+        self._repo.close()
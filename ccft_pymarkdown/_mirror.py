@@ -0,0 +1,188 @@
+"""Clean custom-formatted tables into a separate mirror of the project, never modifying it."""
+
+import logging
+from typing import TYPE_CHECKING
+
+from . import utils
+from ._clean import clean_string
+from .utils import FileExclusionMethod, metrics
+from .utils.metrics import MetricsCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from collections.abc import Set as AbstractSet
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final
+
+    from ._clean_index import CleanIndex
+    from ._path_filter import PathFilter
+
+
+__all__: "Sequence[str]" = ("mirror_clean",)
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+
+def _iter_files_to_mirror(
+    files: "Iterable[Path]",
+    file_exclusion_method: FileExclusionMethod,
+    path_filter: "PathFilter | None",
+    output_directory: "Path",
+) -> "Iterator[Path]":
+    file_path: Path
+    for file_path in files:
+        if file_path.is_dir():
+            yield from _iter_files_to_mirror(
+                utils.get_markdown_files(file_path, file_exclusion_method, path_filter),
+                file_exclusion_method,
+                path_filter,
+                output_directory,
+            )
+            continue
+
+        # NOTE: A mirror within the project would otherwise be found again by later runs
+        if file_path.absolute().is_relative_to(output_directory):
+            logger.debug("Skipping file '%s': within the output directory", file_path)
+            continue
+
+        yield file_path
+
+
+def _link_file(file_path: "Path", mirrored_file_path: "Path") -> None:
+    try:
+        mirrored_file_path.hardlink_to(file_path)
+    except OSError:
+        # NOTE: Hard links cannot cross filesystems (for example into a tmpfs mirror), so a symbolic link is used instead
+        mirrored_file_path.symlink_to(file_path.absolute())
+
+
+def _read_cleaned_markdown(
+    file_path: "Path", clean_index: "CleanIndex | None"
+) -> tuple[str, str] | None:
+    """Retrieve the original & cleaned contents of the given file, if it needs cleaning."""
+    if file_path.suffix != ".md":
+        INVALID_FILE_SUFFIX_MESSAGE: Final[str] = "File is not a markdown file."
+        raise ValueError(INVALID_FILE_SUFFIX_MESSAGE)
+
+    if clean_index is not None and not clean_index.needs_cleaning(file_path):
+        return None
+
+    markdown: str = file_path.read_text()
+    metrics.increment_metric(MetricsCounter.BYTES_READ, len(markdown.encode()))
+
+    cleaned_markdown: str = clean_string(markdown)
+    if cleaned_markdown == markdown:
+        return None
+
+    return markdown, cleaned_markdown
+
+
+def _write_mirrored_file(
+    file_path: "Path", mirrored_file_path: "Path", cleaned: tuple[str, str] | None
+) -> None:
+    mirrored_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # NOTE: Any previously mirrored file is removed first, because writing through a hard link would modify the original file
+    mirrored_file_path.unlink(missing_ok=True)
+
+    if cleaned is None:
+        _link_file(file_path, mirrored_file_path)
+        return
+
+    markdown: str
+    cleaned_markdown: str
+    markdown, cleaned_markdown = cleaned
+
+    mirrored_file_path.write_text(cleaned_markdown)
+    metrics.increment_metric(MetricsCounter.BYTES_WRITTEN, len(cleaned_markdown.encode()))
+    metrics.increment_metric(
+        MetricsCounter.LINES_MODIFIED,
+        sum(
+            cleaned_line != line
+            for line, cleaned_line in zip(
+                markdown.splitlines(), cleaned_markdown.splitlines(), strict=True
+            )
+        ),
+    )
+
+
+def mirror_clean(
+    files: "Iterable[Path]",
+    output_directory: "Path",
+    file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
+    *,
+    skip_errors: bool = False,
+    dry_run: bool = False,
+    root: "Path | None" = None,
+    path_filter: "PathFilter | None" = None,
+    clean_index: "CleanIndex | None" = None,
+) -> "AbstractSet[Path]":
+    """
+    Mirror each given Markdown file into the output directory, cleaning any that need it.
+
+    Files are placed at the same path within the output directory as within the root
+    (defaulting to the project root), and the given files themselves are never modified.
+    Files without any custom-formatted tables are hard-linked (or symbolically linked)
+    into the output directory, rather than copied.
+    Returns the files whose cleaned copies were written.
+    Deleting the output directory leaves no trace of cleaning.
+    """
+    ROOT: Final[Path] = (root if root is not None else utils.get_project_root()).absolute()
+    OUTPUT_DIRECTORY: Final[Path] = output_directory.absolute()
+
+    cleaned_files: set[Path] = set()
+
+    with metrics.time_phase("clean"):
+        file_path: Path
+        for file_path in _iter_files_to_mirror(
+            files, file_exclusion_method, path_filter, OUTPUT_DIRECTORY
+        ):
+            metrics.increment_metric(MetricsCounter.FILES_DISCOVERED)
+
+            try:
+                mirrored_file_path: Path = OUTPUT_DIRECTORY / file_path.absolute().relative_to(
+                    ROOT
+                )
+            except ValueError:
+                NOT_WITHIN_ROOT_MESSAGE: str = (
+                    f"Cannot mirror '{file_path}': File is not within '{ROOT}'."
+                )
+                if not skip_errors:
+                    raise ValueError(NOT_WITHIN_ROOT_MESSAGE) from None
+
+                logger.error(NOT_WITHIN_ROOT_MESSAGE)  # noqa: TRY400
+                metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+                continue
+
+            try:
+                cleaned: tuple[str, str] | None = _read_cleaned_markdown(
+                    file_path, clean_index
+                )
+                if not dry_run:
+                    _write_mirrored_file(file_path, mirrored_file_path, cleaned)
+            except (OSError, ValueError, UnicodeDecodeError) as e:
+                if not skip_errors:
+                    raise e from e
+
+                logger.error(  # noqa: TRY400
+                    "Skipping '%s': %s", file_path, utils.format_exception_to_log_message(e)
+                )
+                metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+                continue
+
+            if cleaned is None:
+                logger.debug("File '%s' contains no custom-formatted tables", file_path)
+                metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+                continue
+
+            if not dry_run:
+                logger.debug("Successfully cleaned file '%s'", mirrored_file_path)
+                metrics.increment_metric(MetricsCounter.FILES_CLEANED)
+
+            cleaned_files.add(file_path)
+
+        if clean_index is not None and not dry_run:
+            clean_index.save()
+
+    return cleaned_files
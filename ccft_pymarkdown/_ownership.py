@@ -0,0 +1,294 @@
+"""Track which running processes are using each cleaned Markdown file."""
+
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .utils import HOLDERS_FILE_SUFFIX, LOCK_FILE_SUFFIX
+
+if sys.platform != "win32":
+    import fcntl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from logging import Logger
+    from typing import Final, TextIO
+
+
+__all__: "Sequence[str]" = (
+    "create_owner_id",
+    "get_live_holders",
+    "lock_file",
+    "set_holders",
+)
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+_LOCK_POLL_INTERVAL: "Final[float]" = 0.01
+_STALE_LOCK_AGE: "Final[float]" = 60
+
+
+@functools.cache
+def _get_host_id() -> str:
+    """
+    Identify the host, boot & PID namespace of the current process.
+
+    Process IDs can only be checked for processes with the same host ID.
+    """
+    host_id_parts: list[str] = [
+        os.environ.get("COMPUTERNAME", "") if sys.platform == "win32" else os.uname().nodename
+    ]
+
+    with contextlib.suppress(OSError):
+        host_id_parts.append(Path("/proc/sys/kernel/random/boot_id").read_text().strip())
+
+    # NOTE: Processes within separate containers on the same host have separate PID namespaces, so their process IDs cannot be compared
+    with contextlib.suppress(OSError):
+        host_id_parts.append(str(Path("/proc/self/ns/pid").readlink()))
+
+    return hashlib.blake2b("\0".join(host_id_parts).encode(), digest_size=8).hexdigest()
+
+
+def _get_process_start_time(pid: int) -> str | None:
+    """
+    Retrieve the start time of the given process, used to tell apart reused process IDs.
+
+    An empty string is returned if start times cannot be retrieved on this platform,
+    whereas `None` is returned if the process is not running.
+    """
+    if not sys.platform.startswith("linux"):
+        return ""
+
+    try:
+        raw_process_stat: str = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+
+    # NOTE: The process's name may contain spaces, so the fields are only split after its closing parenthesis (the start time is the 22nd field)
+    return raw_process_stat.rpartition(")")[2].split()[19]
+
+
+def _get_process_id() -> str:
+    return f"{_get_host_id()}:{os.getpid()}:{_get_process_start_time(os.getpid()) or ''}"
+
+
+def create_owner_id() -> str:
+    """Create a new unique identifier, for a run that will hold cleaned files."""
+    return f"{_get_process_id()}:{uuid.uuid4().hex}"
+
+
+def _is_process_running(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+
+    # NOTE: Windows does not support checking for a running process without terminating it, so all processes are assumed to still be running (files left held by a crashed run can be restored using `restore --force`)
+    if sys.platform == "win32":
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def _is_owner_running(owner_id: str) -> bool:
+    try:
+        host_id: str
+        raw_pid: str
+        start_time: str
+        host_id, raw_pid, start_time, _ = owner_id.split(":", 3)
+        pid: int = int(raw_pid)
+    except ValueError:
+        return False
+
+    # NOTE: Processes on other hosts (or within other containers) cannot be checked, so they are assumed to still be running (files left held by a crashed run can be restored using `restore --force`)
+    if host_id != _get_host_id():
+        return True
+
+    if not _is_process_running(pid):
+        return False
+
+    # NOTE: The start time is also compared, in case the process ID has since been reused by an unrelated process
+    return not start_time or _get_process_start_time(pid) == start_time
+
+
+def _is_same_lock_file(lock_file_stat: os.stat_result, other_stat: os.stat_result) -> bool:
+    # NOTE: The modification time is also compared, because a removed lock file's inode number can be reused straight away by a new lock file
+    return os.path.samestat(lock_file_stat, other_stat) and (
+        lock_file_stat.st_mtime_ns == other_stat.st_mtime_ns
+    )
+
+
+def _is_lock_stale(lock_file_path: "Path", lock_file_stat: os.stat_result) -> bool:
+    if time.time() - lock_file_stat.st_mtime > _STALE_LOCK_AGE:
+        return True
+
+    try:
+        raw_lock_owner_id: str = lock_file_path.read_text().strip()
+    except FileNotFoundError:
+        return False
+
+    # NOTE: An empty lock file has only just been created, and its owner has not yet been written
+    return bool(raw_lock_owner_id) and not _is_owner_running(raw_lock_owner_id)
+
+
+def _remove_stale_lock(lock_file_path: "Path", stale_lock_file_stat: os.stat_result) -> None:
+    """
+    Remove the given stale lock file, unless it has since been replaced by a new lock file.
+
+    The lock file is first atomically renamed, so that it is only removed if it is still the
+    same stale lock file; otherwise the new lock file is put back.
+    """
+    removed_lock_file_path: Path = lock_file_path.with_name(
+        f"{lock_file_path.name}.{uuid.uuid4().hex}"
+    )
+
+    try:
+        lock_file_path.rename(removed_lock_file_path)
+    except FileNotFoundError:
+        return
+
+    try:
+        if _is_same_lock_file(removed_lock_file_path.stat(), stale_lock_file_stat):
+            logger.debug("Removed stale lock file '%s'", lock_file_path)
+            return
+
+        logger.debug("Lock file '%s' is no longer stale, putting it back", lock_file_path)
+
+        # NOTE: Linking never replaces a lock file that has been created in the meantime
+        try:
+            os.link(removed_lock_file_path, lock_file_path)
+        except FileExistsError:
+            logger.warning(
+                "Lock file '%s' was replaced while its owner was still running",
+                lock_file_path,
+            )
+
+    finally:
+        removed_lock_file_path.unlink(missing_ok=True)
+
+
+def _open_exclusive_lock_file(lock_file_path: "Path") -> int:
+    while True:
+        try:
+            return os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                existing_lock_file_stat: os.stat_result = lock_file_path.stat()
+            except FileNotFoundError:
+                continue
+
+            if _is_lock_stale(lock_file_path, existing_lock_file_stat):
+                _remove_stale_lock(lock_file_path, existing_lock_file_stat)
+                continue
+
+            time.sleep(_LOCK_POLL_INTERVAL)
+
+
+def _open_flocked_lock_file(lock_file_path: "Path") -> int:
+    while True:
+        lock_file_descriptor: int = os.open(lock_file_path, os.O_CREAT | os.O_WRONLY)
+
+        try:
+            fcntl.flock(lock_file_descriptor, fcntl.LOCK_EX)
+
+            # NOTE: The previous owner removes the lock file before unlocking it, so a lock file that has since been removed (or replaced) must be opened again
+            is_current_lock_file: bool = os.path.samestat(
+                os.fstat(lock_file_descriptor), lock_file_path.stat()
+            )
+        except FileNotFoundError:
+            is_current_lock_file = False
+        except BaseException:
+            os.close(lock_file_descriptor)
+            raise
+
+        if is_current_lock_file:
+            os.ftruncate(lock_file_descriptor, 0)
+            return lock_file_descriptor
+
+        os.close(lock_file_descriptor)
+
+
+@contextlib.contextmanager
+def lock_file(file_path: "Path") -> "Iterator[None]":
+    """
+    Hold exclusive access to the cleaned state of the given Markdown file.
+
+    Waits until no other process is cleaning or restoring the same file.
+    The lock file is locked using `flock()` for as long as it is held,
+    so the lock is released by the operating system if this process stops.
+    (On Windows, lock files are instead created exclusively,
+    and lock files left by stopped processes are removed once found to be stale.)
+    """
+    lock_file_path: Path = file_path.parent / f"{file_path.name}{LOCK_FILE_SUFFIX}"
+
+    lock_file_descriptor: int = (
+        _open_exclusive_lock_file(lock_file_path)
+        if sys.platform == "win32"
+        else _open_flocked_lock_file(lock_file_path)
+    )
+    lock_file_stat: os.stat_result = os.fstat(lock_file_descriptor)
+
+    try:
+        os.write(lock_file_descriptor, f"{_get_process_id()}:lock\n".encode())
+
+        if sys.platform == "win32":
+            os.close(lock_file_descriptor)
+
+        yield
+
+    finally:
+        # NOTE: Only this process's own lock file is removed, in case another process has since replaced it
+        with contextlib.suppress(FileNotFoundError):
+            if os.path.samestat(lock_file_path.stat(), lock_file_stat):
+                lock_file_path.unlink()
+
+        # NOTE: The lock file is removed before it is unlocked, so that a waiting process never locks a lock file that is about to be removed
+        if sys.platform != "win32":
+            os.close(lock_file_descriptor)
+
+
+def get_live_holders(file_path: "Path") -> "Sequence[str]":
+    """
+    Retrieve the identifiers of the running processes that are using the given cleaned file.
+
+    Should only be called while holding the file's lock.
+    """
+    holders_file_path: Path = file_path.parent / f"{file_path.name}{HOLDERS_FILE_SUFFIX}"
+
+    holders_file: TextIO
+    try:
+        with holders_file_path.open("r") as holders_file:
+            return [
+                owner_id
+                for line in holders_file
+                if (owner_id := line.strip()) and _is_owner_running(owner_id)
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def set_holders(file_path: "Path", owner_ids: "Sequence[str]") -> None:
+    """
+    Store the identifiers of the running processes that are using the given cleaned file.
+
+    Should only be called while holding the file's lock.
+    """
+    holders_file_path: Path = file_path.parent / f"{file_path.name}{HOLDERS_FILE_SUFFIX}"
+
+    if not owner_ids:
+        holders_file_path.unlink(missing_ok=True)
+        return
+
+    holders_file_path.write_text("".join(f"{owner_id}\n" for owner_id in owner_ids))
@@ -0,0 +1,120 @@
+"""Select which Markdown files to clean, using compiled include & exclude glob patterns."""
+
+import re
+from typing import TYPE_CHECKING
+
+from . import utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+    from typing import Final
+
+
+__all__: "Sequence[str]" = ("PathFilter",)
+
+
+def _translate_glob(pattern: str) -> str:
+    regex_parts: list[str] = []
+
+    index: int = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            regex_parts.append("(?:[^/]+/)*")
+            index += 3
+            continue
+
+        if pattern.startswith("**", index):
+            regex_parts.append(".*")
+            index += 2
+            continue
+
+        character: str = pattern[index]
+        index += 1
+
+        if character == "*":
+            regex_parts.append("[^/]*")
+            continue
+
+        if character == "?":
+            regex_parts.append("[^/]")
+            continue
+
+        if character == "[":
+            class_end_index: int = pattern.find("]", index + 1)
+            if class_end_index != -1:
+                character_class: str = pattern[index:class_end_index].replace("\\", "\\\\")
+                if character_class.startswith("!"):
+                    character_class = f"^{character_class[1:]}"
+                regex_parts.append(f"[{character_class}]")
+                index = class_end_index + 1
+                continue
+
+        regex_parts.append(re.escape(character))
+
+    return "".join(regex_parts)
+
+
+def _compile_patterns(patterns: "Iterable[str]") -> "re.Pattern[str] | None":
+    pattern_regexes: list[str] = []
+
+    pattern: str
+    for pattern in patterns:
+        stripped_pattern: str = pattern.strip().rstrip("/")
+        if not stripped_pattern:
+            continue
+
+        # NOTE: Like a `.gitignore` file, patterns containing a slash are matched from the project root, whereas other patterns are matched against every file & directory name
+        is_anchored: bool = "/" in stripped_pattern
+        pattern_regex: str = _translate_glob(stripped_pattern.removeprefix("/"))
+        pattern_regexes.append(
+            f"^{pattern_regex}(?:/|$)" if is_anchored else f"(?:^|/){pattern_regex}(?:/|$)"
+        )
+
+    if not pattern_regexes:
+        return None
+
+    return re.compile("|".join(f"(?:{pattern_regex})" for pattern_regex in pattern_regexes))
+
+
+class PathFilter:
+    """
+    Selection of files using include & exclude glob patterns, relative to the project root.
+
+    All patterns are compiled into a single matcher, so each path is only checked once.
+    A pattern that matches a directory also matches every file within that directory.
+    """
+
+    def __init__(
+        self,
+        include_patterns: "Iterable[str]" = (),
+        exclude_patterns: "Iterable[str]" = (),
+        root: "Path | None" = None,
+    ) -> None:
+        """Compile the given include & exclude glob patterns."""
+        self.root: Path = root if root is not None else utils.get_project_root()
+        self._include_regex: re.Pattern[str] | None = _compile_patterns(include_patterns)
+        self._exclude_regex: re.Pattern[str] | None = _compile_patterns(exclude_patterns)
+
+    def _get_relative_path(self, path: "Path") -> str:
+        absolute_path: Path = path.absolute()
+
+        if not absolute_path.is_relative_to(self.root):
+            return absolute_path.as_posix()
+
+        return absolute_path.relative_to(self.root).as_posix()
+
+    def is_excluded_directory(self, directory_path: "Path") -> bool:
+        """Check whether every file within the given directory is excluded."""
+        return self._exclude_regex is not None and bool(
+            self._exclude_regex.search(self._get_relative_path(directory_path))
+        )
+
+    def matches(self, file_path: "Path") -> bool:
+        """Check whether the given file is selected by the include & exclude patterns."""
+        RELATIVE_PATH: Final[str] = self._get_relative_path(file_path)
+
+        if self._exclude_regex is not None and self._exclude_regex.search(RELATIVE_PATH):
+            return False
+
+        return self._include_regex is None or bool(self._include_regex.search(RELATIVE_PATH))
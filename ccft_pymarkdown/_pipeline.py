@@ -0,0 +1,146 @@
+"""Clean, use & restore Markdown files one at a time, overlapping the work on each file."""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import _ownership as ownership
+from ._clean import iter_clean
+from ._restore import restore
+from .utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Sequence
+    from logging import Logger
+    from typing import Final
+
+    from ._path_filter import PathFilter
+
+
+__all__: "Sequence[str]" = ("pipelined_clean",)
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+_QUEUE_POLL_INTERVAL: "Final[float]" = 0.1
+
+
+def _restore_cleaned_file(file_path: "Path", owner_id: str) -> None:
+    restore(
+        (file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}",), owner_id=owner_id
+    )
+
+
+def _put_cleaned_file(
+    cleaned_files_queue: "queue.Queue[Path | Exception | None]",
+    item: "Path | Exception | None",
+    stop_event: threading.Event,
+) -> bool:
+    while not stop_event.is_set():
+        try:
+            cleaned_files_queue.put(item, timeout=_QUEUE_POLL_INTERVAL)
+        except queue.Full:
+            continue
+
+        return True
+
+    return False
+
+
+def _clean_files_in_background(
+    files: "Iterable[Path]",
+    file_exclusion_method: FileExclusionMethod,
+    cleaned_files_queue: "queue.Queue[Path | Exception | None]",
+    stop_event: threading.Event,
+    *,
+    skip_errors: bool,
+    owner_id: str,
+    path_filter: "PathFilter | None",
+) -> None:
+    try:
+        file_path: Path
+        for file_path in iter_clean(
+            files,
+            file_exclusion_method,
+            skip_errors=skip_errors,
+            owner_id=owner_id,
+            path_filter=path_filter,
+        ):
+            if not _put_cleaned_file(cleaned_files_queue, file_path, stop_event):
+                logger.debug("Cleaning cancelled, restoring unused file '%s'", file_path)
+                _restore_cleaned_file(file_path, owner_id)
+                return
+
+    except Exception as e:  # noqa: BLE001
+        _put_cleaned_file(cleaned_files_queue, e, stop_event)
+        return
+
+    _put_cleaned_file(cleaned_files_queue, None, stop_event)
+
+
+def pipelined_clean(
+    files: "Iterable[Path]",
+    file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
+    *,
+    skip_errors: bool = False,
+    max_pending_files: int = 8,
+    path_filter: "PathFilter | None" = None,
+) -> "Generator[Path]":
+    """
+    Clean custom-formatted tables within each given Markdown file, restoring each after use.
+
+    Files are cleaned in a background thread, ahead of being yielded.
+    Each yielded file is restored as soon as the next file is requested,
+    so only a bounded number of files (roughly 'max_pending_files') are modified at any moment.
+    Any files that were cleaned but not yet used are restored when this generator is closed.
+    """
+    if max_pending_files < 1:
+        INVALID_MAX_PENDING_FILES_MESSAGE: Final[str] = (
+            "Maximum number of pending files must be at least 1."
+        )
+        raise ValueError(INVALID_MAX_PENDING_FILES_MESSAGE)
+
+    owner_id: str = ownership.create_owner_id()
+    cleaned_files_queue: queue.Queue[Path | Exception | None] = queue.Queue(
+        maxsize=max_pending_files
+    )
+    stop_event: threading.Event = threading.Event()
+    cleaning_thread: threading.Thread = threading.Thread(
+        target=_clean_files_in_background,
+        args=(files, file_exclusion_method, cleaned_files_queue, stop_event),
+        kwargs={"skip_errors": skip_errors, "owner_id": owner_id, "path_filter": path_filter},
+        name="ccft-pymarkdown-clean",
+        daemon=True,
+    )
+    cleaning_thread.start()
+
+    try:
+        while True:
+            item: Path | Exception | None = cleaned_files_queue.get()
+            if item is None:
+                return
+
+            if isinstance(item, Exception):
+                raise item
+
+            try:
+                yield item
+            finally:
+                _restore_cleaned_file(item, owner_id)
+
+    finally:
+        stop_event.set()
+
+        pending_item: Path | Exception | None
+        while cleaning_thread.is_alive() or not cleaned_files_queue.empty():
+            try:
+                pending_item = cleaned_files_queue.get(timeout=_QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if isinstance(pending_item, Path):
+                logger.debug("Restoring unused file '%s'", pending_item)
+                _restore_cleaned_file(pending_item, owner_id)
+
+        cleaning_thread.join()
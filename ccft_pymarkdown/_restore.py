@@ -1,10 +1,13 @@
 """Perform the restoration of Markdown files that had custom-formatted tables cleaned."""
 
+import contextlib
 import logging
 from typing import TYPE_CHECKING
 
+from . import _ownership as ownership
 from . import utils
-from .utils import CONVERSION_FILE_SUFFIX
+from .utils import CONVERSION_FILE_SUFFIX, metrics
+from .utils.metrics import MetricsCounter
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
@@ -33,8 +36,21 @@ def _check_file(file_path: "Path") -> "Literal[True]":
     return True
 
 
-def restore(files: "Iterable[Path]", *, dry_run: bool = False) -> "AbstractSet[Path]":
-    """Return given Markdown files to their original state before cleaning."""
+def restore(
+    files: "Iterable[Path]",
+    *,
+    dry_run: bool = False,
+    owner_id: str | None = None,
+    force: bool = False,
+) -> "AbstractSet[Path]":
+    """
+    Return given Markdown files to their original state before cleaning.
+
+    If an owner ID is given, each file is only restored once no other running process is
+    still using it; otherwise any files still in use by a running process are skipped.
+    If forced, every file is restored, even if it appears to still be in use
+    (for example, left behind by a crashed run whose process cannot be checked).
+    """
     restored_files: set[Path] = set()
 
     file_path: Path
@@ -45,7 +61,9 @@ def restore(files: "Iterable[Path]", *, dry_run: bool = False) -> "AbstractSet[P
 
         if file_path.is_dir():
             logger.debug("Recursing into directory '%s'", file_path)
-            restored_files.update(restore(utils.get_original_files(file_path)))
+            restored_files.update(
+                restore(utils.get_original_files(file_path), owner_id=owner_id, force=force)
+            )
             continue
 
         _check_file(file_path)
@@ -53,13 +71,51 @@ def restore(files: "Iterable[Path]", *, dry_run: bool = False) -> "AbstractSet[P
         logger.debug("File '%s' passed pre-restoring checks", file_path)
 
         restored_file_path: Path = file_path.parent / file_path.stem
-        if restored_file_path.exists():
-            logger.debug("Deleting cleaned file: '%s'", restored_file_path)
-            if not dry_run:
-                restored_file_path.unlink()
 
-        if not dry_run:
-            file_path.rename(file_path.parent / file_path.stem)
+        with (
+            metrics.time_phase("restore"),
+            ownership.lock_file(restored_file_path)
+            if not dry_run
+            else contextlib.nullcontext(),
+        ):
+            live_holders: Sequence[str] = [
+                live_holder
+                for live_holder in ownership.get_live_holders(restored_file_path)
+                if live_holder != owner_id
+            ]
+
+            if live_holders and force:
+                logger.debug(
+                    "Forcing restoring file '%s', despite it being in use", restored_file_path
+                )
+                live_holders = ()
+
+            if live_holders:
+                if owner_id is None:
+                    logger.warning(
+                        "Skipping '%s': File is currently in use by another running process "
+                        "(if that process has crashed, restore the file using '--force')",
+                        file_path,
+                    )
+                    continue
+
+                logger.debug(
+                    "File '%s' still in use by another running process, leaving it cleaned",
+                    restored_file_path,
+                )
+                if not dry_run:
+                    ownership.set_holders(restored_file_path, live_holders)
+
+            else:
+                if restored_file_path.exists():
+                    logger.debug("Deleting cleaned file: '%s'", restored_file_path)
+                    if not dry_run:
+                        restored_file_path.unlink()
+
+                if not dry_run:
+                    file_path.rename(restored_file_path)
+                    ownership.set_holders(restored_file_path, ())
+                    metrics.increment_metric(MetricsCounter.FILES_RESTORED)
 
         restored_files.add(file_path)
 
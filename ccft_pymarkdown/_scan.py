@@ -1,11 +1,27 @@
 """Console entry point for CCFT-PyMarkdown."""
 
+import contextlib
+import dataclasses
+import itertools
+import json
+import logging
+import multiprocessing
 import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
 from typing import TYPE_CHECKING, override
 
+from ._shard import get_file_cost_key
+from .utils import metrics
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from pathlib import Path
+    from collections.abc import Iterable, Mapping, Sequence
+    from logging import Logger
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import SpawnProcess
+    from typing import Final, TextIO
 
     from pymarkdown.api import (
         PyMarkdownApi,
@@ -14,20 +30,175 @@ if TYPE_CHECKING:
         PyMarkdownScanPathResult,
     )
 
+    type _ScanRequest = tuple[str, str | None] | None
+    type _ScanResponse = PyMarkdownScanPathResult | str | None
 
-__all__: "Sequence[str]" = ("Scanner",)
 
+__all__: "Sequence[str]" = ("DEFAULT_SCAN_BATCH_SIZE", "Scanner", "create_pymarkdown_api")
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+DEFAULT_SCAN_BATCH_SIZE: "Final[int]" = 64
+
+
+def create_pymarkdown_api() -> "PyMarkdownApi":
+    """Create a PyMarkdown API instance, configured to scan Markdown files."""
+    from pymarkdown.api import PyMarkdownApi  # noqa: PLC0415
+
+    return (
+        PyMarkdownApi(inherit_logging=False)
+        .log_error_and_above()
+        .enable_strict_configuration()
+    )
+
+
+def _run_scan_worker(
+    connection: "Connection[_ScanResponse, _ScanRequest]",
+    pymarkdown_api: "PyMarkdownApi",
+) -> None:
+    from pymarkdown.api import PyMarkdownApiException  # noqa: PLC0415
+
+    connection.send(None)
+
+    while True:
+        scan_request: _ScanRequest = connection.recv()
+        if scan_request is None:
+            return
+
+        raw_file_path: str
+        markdown: str | None
+        raw_file_path, markdown = scan_request
+
+        try:
+            connection.send(
+                pymarkdown_api.scan_path(raw_file_path)
+                if markdown is None
+                else pymarkdown_api.scan_string(markdown)
+            )
+        except PyMarkdownApiException as e:
+            connection.send(e.reason)
+
+
+def _get_linked_file_path(linked_files: "Mapping[str, Path]", raw_link_path: str) -> str:
+    linked_file_path: Path | None = linked_files.get(Path(raw_link_path).name)
+    return str(linked_file_path) if linked_file_path is not None else raw_link_path
+
+
+class _ScanWorker:
+    """Separate process to scan files within, so that a stalled scan can be killed."""
 
-class Scanner:
     @override
     def __init__(self, pymarkdown_api: "PyMarkdownApi") -> None:
-        self.pymarkdown_api: PyMarkdownApi = pymarkdown_api
+        parent_connection: Connection[_ScanRequest, _ScanResponse]
+        child_connection: Connection[_ScanResponse, _ScanRequest]
+        parent_connection, child_connection = multiprocessing.get_context("spawn").Pipe()
+
+        self._connection: Connection[_ScanRequest, _ScanResponse] = parent_connection
+        self._process: SpawnProcess = multiprocessing.get_context("spawn").Process(
+            target=_run_scan_worker,
+            args=(child_connection, pymarkdown_api),
+            name="ccft-pymarkdown-scan",
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+
+        # NOTE: Waiting until the worker process is ready ensures that its start-up time is not counted towards the timeout of the first scanned file
+        self._connection.recv()
+
+    def scan(
+        self, file_path: "Path", markdown: str | None, timeout: float
+    ) -> "PyMarkdownScanPathResult | None":
+        """
+        Scan the given file, returning None if scanning took longer than the timeout.
+
+        If Markdown content is given, it is scanned instead of the file's contents on disk.
+        """
+        from pymarkdown.api import PyMarkdownApiException  # noqa: PLC0415
+
+        self._connection.send((str(file_path), markdown))
+
+        if not self._connection.poll(timeout):
+            return None
+
+        try:
+            scan_result: _ScanResponse = self._connection.recv()
+        except EOFError:
+            WORKER_EXITED_MESSAGE: Final[str] = (
+                f"Scanning process exited unexpectedly while scanning '{file_path}'."
+            )
+            raise PyMarkdownApiException(WORKER_EXITED_MESSAGE) from None
+
+        if scan_result is None or isinstance(scan_result, str):
+            raise PyMarkdownApiException(scan_result or "Unknown scanning error.")
+
+        return scan_result
+
+    def close(self, *, kill: bool = False) -> None:
+        """Stop the worker process, killing it if it is still scanning."""
+        if self._process.is_alive() and not kill:
+            with contextlib.suppress(OSError):
+                self._connection.send(None)
+
+            self._process.join(timeout=1)
+
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+
+        self._connection.close()
+
+
+class Scanner:
+    @override
+    def __init__(
+        self,
+        pymarkdown_api: "PyMarkdownApi | None" = None,
+        *,
+        scan_timeout: float | None = None,
+    ) -> None:
+        self._pymarkdown_api: PyMarkdownApi | None = pymarkdown_api
+        self.scan_timeout: float | None = scan_timeout
+        self._scan_worker: _ScanWorker | None = None
         self._scan_failures: list[PyMarkdownScanFailure] = []
         self._pragma_errors: list[PyMarkdownPragmaError] = []
+        self._timed_out_files: dict[str, float | None] = {}
+        self._file_costs: dict[str, float] = {}
+
+    @property
+    def pymarkdown_api(self) -> "PyMarkdownApi":
+        if self._pymarkdown_api is None:
+            NO_PYMARKDOWN_API_MESSAGE: Final[str] = (
+                "Cannot scan files with a scanner that was created without a PyMarkdown API."
+            )
+            raise RuntimeError(NO_PYMARKDOWN_API_MESSAGE)
+
+        return self._pymarkdown_api
 
     @property
     def encountered_failures(self) -> bool:
-        return bool(self._scan_failures) or bool(self._pragma_errors)
+        return (
+            bool(self._scan_failures)
+            or bool(self._pragma_errors)
+            or bool(self._timed_out_files)
+        )
+
+    def get_failure_counts(self) -> "Mapping[str, int]":
+        """Count the failures found so far, for each rule ID."""
+        failure_counts: Counter[str] = Counter(
+            scan_failure.rule_id for scan_failure in self._scan_failures
+        )
+        if self._pragma_errors:
+            failure_counts["INLINE"] = len(self._pragma_errors)
+        if self._timed_out_files:
+            failure_counts["TIMEOUT"] = len(self._timed_out_files)
+
+        return failure_counts
+
+    @property
+    def file_costs(self) -> "Mapping[str, float]":
+        """Retrieve the time taken to scan each file, in seconds."""
+        return self._file_costs
 
     def log_errors(self) -> None:
         pragma_error: PyMarkdownPragmaError
@@ -50,7 +221,269 @@ class Scanner:
                 f"({scan_failure.rule_name})\n"
             )
 
+        timed_out_file: str
+        scan_timeout: float | None
+        for timed_out_file, scan_timeout in self._timed_out_files.items():
+            sys.stdout.write(
+                f"{timed_out_file}: "
+                "TIMEOUT: "
+                + (
+                    f"Scanning took longer than {scan_timeout:g} seconds\n"
+                    if scan_timeout is not None
+                    else "Scanning took too long\n"
+                )
+            )
+
+    def log_slowest_files(self, count: int) -> None:
+        """Report the given number of files that took the longest to scan."""
+        if not self._file_costs:
+            return
+
+        logger.info(
+            "Slowest files to scan:\n%s",
+            "\n".join(
+                f"{file_cost:.3f}s {file_cost_key}"
+                for file_cost_key, file_cost in sorted(
+                    self._file_costs.items(), key=lambda item: item[1], reverse=True
+                )[:count]
+            ),
+        )
+
+    def _get_scan_worker(self) -> "_ScanWorker":
+        if self._scan_worker is None:
+            self._scan_worker = _ScanWorker(self.pymarkdown_api)
+
+        return self._scan_worker
+
+    def _scan(self, file_path: "Path", markdown: str | None) -> None:
+        scan_worker: _ScanWorker | None = (
+            self._get_scan_worker() if self.scan_timeout is not None else None
+        )
+
+        start_time: float = time.perf_counter()
+        with metrics.time_phase("scan"):
+            scan_result: PyMarkdownScanPathResult | None = (
+                scan_worker.scan(file_path, markdown, self.scan_timeout)
+                if scan_worker is not None and self.scan_timeout is not None
+                else self.pymarkdown_api.scan_path(str(file_path))
+                if markdown is None
+                else self.pymarkdown_api.scan_string(markdown)
+            )
+        self._file_costs[get_file_cost_key(file_path)] = time.perf_counter() - start_time
+
+        if scan_result is None:
+            logger.warning(
+                "Scanning '%s' took longer than %g seconds, skipping file",
+                file_path,
+                self.scan_timeout,
+            )
+            self._timed_out_files[str(file_path)] = self.scan_timeout
+
+            if scan_worker is not None:
+                scan_worker.close(kill=True)
+                self._scan_worker = None
+
+            return
+
+        if markdown is None:
+            self._pragma_errors.extend(scan_result.pragma_errors)
+            self._scan_failures.extend(scan_result.scan_failures)
+            return
+
+        self._pragma_errors.extend(
+            dataclasses.replace(pragma_error, file_path=str(file_path))
+            for pragma_error in scan_result.pragma_errors
+        )
+        self._scan_failures.extend(
+            dataclasses.replace(scan_failure, scan_file=str(file_path))
+            for scan_failure in scan_result.scan_failures
+        )
+
     def scan_file_path(self, file_path: "Path") -> None:
-        scan_result: PyMarkdownScanPathResult = self.pymarkdown_api.scan_path(str(file_path))
-        self._pragma_errors.extend(scan_result.pragma_errors)
-        self._scan_failures.extend(scan_result.scan_failures)
+        self._scan(file_path, None)
+
+    def _scan_batch(self, files: "Sequence[Path]") -> None:
+        from pymarkdown.api import PyMarkdownApiException  # noqa: PLC0415
+
+        file_path: Path
+        if len(files) == 1 or self.scan_timeout is not None:
+            for file_path in files:
+                self._scan(file_path, None)
+            return
+
+        with tempfile.TemporaryDirectory(prefix="ccft-pymarkdown-") as raw_batch_directory:
+            # NOTE: Each file is linked under a unique (zero-padded, so that results keep the same order) name, so that files sharing the same name (e.g. many 'README.md' files) can be scanned together within one flat directory
+            linked_files: dict[str, Path] = {}
+            try:
+                index: int
+                for index, file_path in enumerate(files):
+                    link_path: Path = (
+                        Path(raw_batch_directory) / f"{index:0{len(str(len(files)))}d}.md"
+                    )
+                    link_path.symlink_to(file_path.resolve())
+                    linked_files[link_path.name] = file_path
+            except OSError as e:
+                logger.debug(
+                    "Cannot link files to scan as a batch, scanning individually: %s", e
+                )
+                for file_path in files:
+                    self._scan(file_path, None)
+                return
+
+            start_time: float = time.perf_counter()
+            try:
+                with metrics.time_phase("scan"):
+                    scan_result: PyMarkdownScanPathResult = self.pymarkdown_api.scan_path(
+                        raw_batch_directory
+                    )
+            except PyMarkdownApiException as e:
+                # NOTE: Scanning each file individually ensures that any error is reported against the file that caused it
+                logger.debug("Scanning batch failed, scanning individually: %s", e)
+                for file_path in files:
+                    self._scan(file_path, None)
+                return
+
+            self._record_batch_costs(files, time.perf_counter() - start_time)
+
+        self._pragma_errors.extend(
+            dataclasses.replace(
+                pragma_error,
+                file_path=_get_linked_file_path(linked_files, pragma_error.file_path),
+            )
+            for pragma_error in scan_result.pragma_errors
+        )
+        self._scan_failures.extend(
+            dataclasses.replace(
+                scan_failure,
+                scan_file=_get_linked_file_path(linked_files, scan_failure.scan_file),
+            )
+            for scan_failure in scan_result.scan_failures
+        )
+
+    def _record_batch_costs(self, files: "Sequence[Path]", batch_cost: float) -> None:
+        # NOTE: The time taken to scan each file within a batch cannot be measured, so the batch's time is split in proportion to each file's size
+        file_sizes: dict[Path, int] = {}
+
+        file_path: Path
+        for file_path in files:
+            try:
+                file_sizes[file_path] = max(file_path.stat().st_size, 1)
+            except OSError:
+                file_sizes[file_path] = 1
+
+        total_file_size: int = sum(file_sizes.values())
+
+        file_size: int
+        for file_path, file_size in file_sizes.items():
+            self._file_costs[get_file_cost_key(file_path)] = (
+                batch_cost * file_size / total_file_size
+            )
+
+    def scan_file_paths(
+        self,
+        files: "Iterable[Path]",
+        *,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        fail_fast: bool = False,
+    ) -> None:
+        """
+        Scan the given files, handing many files to PyMarkdown within each single call.
+
+        Batching avoids repeating PyMarkdown's set-up for every file.
+        The time taken to scan each file is estimated from the file's size,
+        and files are always scanned individually when a scan timeout is set.
+        If failing fast, no further batches are scanned once any failures have been found.
+        """
+        if batch_size < 1:
+            INVALID_BATCH_SIZE_MESSAGE: Final[str] = "Scan batch size must be at least 1."
+            raise ValueError(INVALID_BATCH_SIZE_MESSAGE)
+
+        batch: tuple[Path, ...]
+        for batch in itertools.batched(files, batch_size):
+            self._scan_batch(batch)
+
+            if fail_fast and self.encountered_failures:
+                logger.debug("Stopping scanning after the first failure")
+                return
+
+    def scan_string(self, markdown: str, file_path: "Path") -> None:
+        """Scan the given Markdown content, reporting any errors against the given file."""
+        if not markdown.strip():
+            logger.debug("Skipping scanning '%s': file is empty", file_path)
+            self._file_costs[get_file_cost_key(file_path)] = 0
+            return
+
+        self._scan(file_path, markdown)
+
+    def close(self) -> None:
+        """Stop any separate process used to scan files."""
+        if self._scan_worker is not None:
+            self._scan_worker.close()
+            self._scan_worker = None
+
+    def write_results(self, results_file: "TextIO") -> None:
+        """Export all the errors & file costs collected so far, to be merged later."""
+        json.dump(
+            {
+                "pragma_errors": [
+                    dataclasses.asdict(pragma_error) for pragma_error in self._pragma_errors
+                ],
+                "scan_failures": [
+                    dataclasses.asdict(scan_failure) for scan_failure in self._scan_failures
+                ],
+                "timed_out_files": self._timed_out_files,
+                "file_costs": self._file_costs,
+            },
+            results_file,
+            indent=2,
+        )
+        results_file.write("\n")
+
+    def read_results(self, results_file: "TextIO") -> None:
+        """Merge the errors & file costs, exported by another scanner, into this scanner."""
+        from pymarkdown.api import PyMarkdownPragmaError, PyMarkdownScanFailure  # noqa: PLC0415
+
+        raw_results: object = json.load(results_file)
+
+        INVALID_RESULTS_FILE_MESSAGE: Final[str] = (
+            f"Results file '{results_file.name}' is not a valid CCFT-PyMarkdown results file."
+        )
+
+        if not isinstance(raw_results, dict):
+            raise ValueError(INVALID_RESULTS_FILE_MESSAGE)  # noqa: TRY004
+
+        raw_pragma_errors: object = raw_results.get("pragma_errors", [])
+        raw_scan_failures: object = raw_results.get("scan_failures", [])
+        raw_timed_out_files: object = raw_results.get("timed_out_files", {})
+        raw_file_costs: object = raw_results.get("file_costs", {})
+        if (
+            not isinstance(raw_pragma_errors, list)
+            or not isinstance(raw_scan_failures, list)
+            or not isinstance(raw_timed_out_files, dict)
+            or not isinstance(raw_file_costs, dict)
+        ):
+            raise ValueError(INVALID_RESULTS_FILE_MESSAGE)  # noqa: TRY004
+
+        try:
+            self._pragma_errors.extend(
+                PyMarkdownPragmaError(**raw_pragma_error)
+                for raw_pragma_error in raw_pragma_errors
+            )
+            self._scan_failures.extend(
+                PyMarkdownScanFailure(**raw_scan_failure)
+                for raw_scan_failure in raw_scan_failures
+            )
+            # NOTE: Each timed-out file's scan timeout is stored with it, because the merging scanner (& each shard) may not share the same scan timeout
+            self._timed_out_files.update(
+                (
+                    str(raw_timed_out_file),
+                    float(scan_timeout) if scan_timeout is not None else None,
+                )
+                for raw_timed_out_file, scan_timeout in raw_timed_out_files.items()
+            )
+            self._file_costs.update(
+                (str(file_cost_key), float(file_cost))
+                for file_cost_key, file_cost in raw_file_costs.items()
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(INVALID_RESULTS_FILE_MESSAGE) from e
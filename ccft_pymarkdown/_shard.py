@@ -0,0 +1,168 @@
+"""Split the Markdown files to lint into balanced shards for running across many machines."""
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from . import utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final, TextIO
+
+
+__all__: "Sequence[str]" = (
+    "get_file_cost_key",
+    "load_file_costs",
+    "save_file_costs",
+    "select_shard",
+)
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+
+def get_file_cost_key(file_path: "Path") -> str:
+    """
+    Convert a file path into a stable key used to store its recorded scanning cost.
+
+    Keys are made relative to the project root,
+    so recorded costs can be shared between checkouts at different locations.
+    """
+    try:
+        return file_path.resolve().relative_to(utils.get_project_root().resolve()).as_posix()
+    except ValueError:
+        return file_path.as_posix()
+
+
+def load_file_costs(timings_file_path: "Path") -> "Mapping[str, float]":
+    """Retrieve the per-file scanning costs recorded by a previous run."""
+    if not timings_file_path.is_file():
+        logger.debug(
+            "Timings file '%s' does not exist, falling back to file sizes", timings_file_path
+        )
+        return {}
+
+    timings_file: TextIO
+    with timings_file_path.open("r") as timings_file:
+        raw_file_costs: object = json.load(timings_file)
+
+    if not isinstance(raw_file_costs, dict):
+        INVALID_TIMINGS_FILE_MESSAGE: Final[str] = (
+            f"Timings file '{timings_file_path}' does not contain a mapping of file costs."
+        )
+        raise ValueError(INVALID_TIMINGS_FILE_MESSAGE)  # noqa: TRY004
+
+    return {
+        str(file_cost_key): float(file_cost)
+        for file_cost_key, file_cost in raw_file_costs.items()
+        if isinstance(file_cost, int | float) and file_cost >= 0
+    }
+
+
+def save_file_costs(timings_file_path: "Path", file_costs: "Mapping[str, float]") -> None:
+    """Store the given per-file scanning costs, to balance the shards of future runs."""
+    timings_file: TextIO
+    with timings_file_path.open("w") as timings_file:
+        json.dump(dict(sorted(file_costs.items())), timings_file, indent=2)
+        timings_file.write("\n")
+
+
+def _estimate_file_costs(
+    files: "Iterable[Path]", recorded_file_costs: "Mapping[str, float]"
+) -> dict["Path", float]:
+    file_costs: dict[Path, float] = {}
+    unknown_file_sizes: dict[Path, int] = {}
+    known_total_cost: float = 0
+    known_total_size: int = 0
+
+    file_path: Path
+    for file_path in files:
+        file_size: int
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
+            file_size = 0
+
+        recorded_file_cost: float | None = recorded_file_costs.get(
+            get_file_cost_key(file_path)
+        )
+
+        if recorded_file_cost is None:
+            unknown_file_sizes[file_path] = file_size
+            continue
+
+        file_costs[file_path] = recorded_file_cost
+        known_total_cost += recorded_file_cost
+        known_total_size += file_size
+
+    if unknown_file_sizes:
+        logger.debug(
+            "No recorded costs for %d files, estimating their costs from file sizes",
+            len(unknown_file_sizes),
+        )
+
+    # NOTE: File sizes are converted into the same units as the recorded costs, so that files with and without a recorded cost can be balanced against each other
+    cost_per_byte: float = (
+        known_total_cost / known_total_size
+        if known_total_size > 0 and known_total_cost > 0
+        else 1
+    )
+
+    for file_path, file_size in unknown_file_sizes.items():
+        file_costs[file_path] = file_size * cost_per_byte
+
+    return file_costs
+
+
+def select_shard(
+    files: "Iterable[Path]",
+    shard_index: int,
+    shard_count: int,
+    recorded_file_costs: "Mapping[str, float] | None" = None,
+) -> "Sequence[Path]":
+    """
+    Select the files that belong to the given shard (1-indexed), out of all the given files.
+
+    Files are divided by their recorded (or estimated) scanning cost,
+    so that each shard takes a similar amount of time to lint.
+    The division is deterministic,
+    so every shard can be selected independently on a different machine.
+    """
+    if shard_count < 1 or not 1 <= shard_index <= shard_count:
+        INVALID_SHARD_MESSAGE: Final[str] = (
+            f"Invalid shard {shard_index}/{shard_count}: "
+            "shard index must be between 1 and the number of shards."
+        )
+        raise ValueError(INVALID_SHARD_MESSAGE)
+
+    file_costs: Mapping[Path, float] = _estimate_file_costs(
+        set(files), recorded_file_costs or {}
+    )
+
+    shard_loads: list[float] = [0] * shard_count
+    selected_files: list[Path] = []
+
+    file_path: Path
+    for file_path in sorted(
+        file_costs,
+        key=lambda file_path: (-file_costs[file_path], get_file_cost_key(file_path)),
+    ):
+        lightest_shard_index: int = min(
+            range(shard_count), key=lambda index: (shard_loads[index], index)
+        )
+        shard_loads[lightest_shard_index] += file_costs[file_path]
+
+        if lightest_shard_index == shard_index - 1:
+            selected_files.append(file_path)
+
+    logger.debug(
+        "Selected %d files for shard %d/%d, with an estimated cost of %g",
+        len(selected_files),
+        shard_index,
+        shard_count,
+        shard_loads[shard_index - 1],
+    )
+
+    return sorted(selected_files)
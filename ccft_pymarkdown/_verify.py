@@ -0,0 +1,73 @@
+"""Verify that restored Markdown files exactly match their contents before cleaning."""
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .utils import metrics
+from .utils.metrics import MetricsCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from logging import Logger
+    from pathlib import Path
+    from typing import BinaryIO, Final
+
+
+__all__: "Sequence[str]" = ("find_mismatched_files", "hash_contents", "hash_file")
+
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
+_HASH_ALGORITHM: "Final[str]" = "blake2b"
+
+
+def hash_contents(contents: bytes) -> str:
+    """Hash the given original contents of a file, to verify the file once restored."""
+    return hashlib.new(_HASH_ALGORITHM, contents).hexdigest()
+
+
+def hash_file(file_path: "Path") -> str | None:
+    """Hash the contents of the given file, returning None if it cannot be read."""
+    file: BinaryIO
+    try:
+        with file_path.open("rb") as file:
+            digest: str = hashlib.file_digest(file, _HASH_ALGORITHM).hexdigest()
+    except OSError:
+        return None
+
+    metrics.increment_metric(MetricsCounter.BYTES_READ, file_path.stat().st_size)
+    return digest
+
+
+def _hash_files(file_paths: "Sequence[Path]") -> "Sequence[str | None]":
+    if len(file_paths) <= 1:
+        return [hash_file(file_path) for file_path in file_paths]
+
+    # NOTE: Hashing releases the GIL, so each file is read & hashed in parallel using threads
+    executor: ThreadPoolExecutor
+    with ThreadPoolExecutor(thread_name_prefix="ccft-pymarkdown-verify") as executor:
+        return list(executor.map(hash_file, file_paths))
+
+
+def find_mismatched_files(expected_hashes: "Mapping[Path, str]") -> "Sequence[Path]":
+    """
+    Check each given file still has its expected hash, returning any mismatched files.
+
+    Mismatched files are returned in a stable (sorted) order.
+    """
+    file_paths: Sequence[Path] = sorted(expected_hashes)
+
+    with metrics.time_phase("verify"):
+        digests: Sequence[str | None] = _hash_files(file_paths)
+
+    mismatched_files: list[Path] = []
+
+    file_path: Path
+    digest: str | None
+    for file_path, digest in zip(file_paths, digests, strict=True):
+        if digest != expected_hashes[file_path]:
+            logger.debug("File '%s' does not match its original contents", file_path)
+            mismatched_files.append(file_path)
+
+    return mismatched_files
@@ -1,26 +1,36 @@
 """Console entry point for CCFT-PyMarkdown."""
 
-import importlib.metadata
+import contextlib
+import functools
 import importlib.util
+import itertools
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import click
-from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException
 
 from . import utils
-from ._clean import clean
+from ._clean import clean, clean_string
+from ._clean_index import CleanIndex
+from ._git_blobs import GitBlobReader
+from ._mirror import mirror_clean
+from ._path_filter import PathFilter
+from ._pipeline import pipelined_clean
 from ._restore import restore
-from ._scan import Scanner
+from ._scan import DEFAULT_SCAN_BATCH_SIZE, Scanner, create_pymarkdown_api
+from ._shard import load_file_costs, save_file_costs, select_shard
 from .context_manager import CleanCustomFormattedTables
-from .utils import PROJECT_ROOT, FileExclusionMethod
+from .utils import FileExclusionMethod
+from .utils.metrics import MetricsCounter, MetricsFormat
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Generator, Iterable, Iterator, Sequence
     from collections.abc import Set as AbstractSet
     from logging import Logger
-    from typing import Final
+    from typing import BinaryIO, Final, TextIO
+
+    from .utils.metrics import Metrics
 
 
 __all__: "Sequence[str]" = ("run",)
@@ -44,6 +54,7 @@ def _callback_verbose(ctx: click.Context, _param: click.Parameter, value: object
         ctx.obj["verbosity"] = value
 
     utils.setup_logging(value)
+    ctx.call_on_close(utils.shutdown_logging)
 
 
 def _callback_mutually_exclusive_verbose_and_quiet(
@@ -74,6 +85,7 @@ def _callback_mutually_exclusive_verbose_and_quiet(
     ctx.obj["verbosity"] = -1
 
     utils.setup_logging(-1)
+    ctx.call_on_close(utils.shutdown_logging)
 
 
 def _callback_validate_with_git(
@@ -125,7 +137,7 @@ def _callback_validate_exclude_hidden(
                 "and without using manual hidden-file exclusion rules "
                 f"can lead to cleaning many additional files{
                     ' (For example files within the .venv/ directory)'
-                    if PROJECT_ROOT.joinpath('.venv').is_dir()
+                    if utils.get_project_root().joinpath('.venv').is_dir()
                     else ''
                 }. Are you sure you wish to continue scanning all files?"
             ),
@@ -136,6 +148,55 @@ def _callback_validate_exclude_hidden(
     return value
 
 
+def _callback_validate_read_from_git(
+    ctx: click.Context, param: click.Parameter, value: object
+) -> object:
+    if value and importlib.util.find_spec("git") is None:
+        raise click.BadOptionUsage(
+            option_name=param.name or "from-index",
+            message=(
+                f"Cannot use '{param.opts[0]}' when the [git-python] extra is not installed."
+            ),
+            ctx=ctx,
+        )
+
+    return value
+
+
+def _callback_shard(
+    ctx: click.Context, param: click.Parameter, value: object
+) -> tuple[int, int] | None:
+    if value is None:
+        return None
+
+    if not isinstance(value, str):
+        INVALID_OPTION_TYPE_MESSAGE: Final[str] = (
+            f"Expected str, got {type(value)} for 'shard' value."
+        )
+        raise TypeError(INVALID_OPTION_TYPE_MESSAGE)
+
+    raw_shard_index: str
+    raw_shard_count: str
+    raw_shard_index, _, raw_shard_count = value.partition("/")
+
+    try:
+        shard_index: int = int(raw_shard_index)
+        shard_count: int = int(raw_shard_count)
+    except ValueError:
+        INVALID_SHARD_FORMAT_MESSAGE: Final[str] = (
+            f"{value!r} is not in the format 'INDEX/COUNT' (for example '1/4')."
+        )
+        raise click.BadParameter(INVALID_SHARD_FORMAT_MESSAGE, ctx=ctx, param=param) from None
+
+    if shard_count < 1 or not 1 <= shard_index <= shard_count:
+        INVALID_SHARD_INDEX_MESSAGE: Final[str] = (
+            f"{value!r} must have an index between 1 and the number of shards."
+        )
+        raise click.BadParameter(INVALID_SHARD_INDEX_MESSAGE, ctx=ctx, param=param)
+
+    return shard_index, shard_count
+
+
 def _callback_dry_run(_ctx: click.Context, _param: click.Parameter, value: object) -> bool:
     if not isinstance(value, bool):
         INVALID_OPTION_TYPE_MESSAGE: Final[str] = (
@@ -153,13 +214,74 @@ def _callback_dry_run(_ctx: click.Context, _param: click.Parameter, value: objec
     return value
 
 
+def _write_metrics(
+    collected_metrics: "Metrics", metrics_file_path: Path, metrics_format: MetricsFormat
+) -> None:
+    utils.metrics.stop_collecting_metrics()
+
+    try:
+        metrics_file: TextIO
+        with metrics_file_path.open("w") as metrics_file:
+            collected_metrics.write(metrics_file, metrics_format)
+    except OSError as e:
+        logger.error(  # noqa: TRY400
+            "Cannot export metrics to '%s': %s",
+            metrics_file_path,
+            utils.format_exception_to_log_message(e),
+        )
+
+
+def _clean_markdown_from_git(markdown: str) -> str:
+    cleaned_markdown: str
+    with utils.metrics.time_phase("clean"):
+        cleaned_markdown = clean_string(markdown)
+
+    if cleaned_markdown != markdown:
+        utils.metrics.increment_metric(MetricsCounter.FILES_CLEANED)
+        utils.metrics.increment_metric(
+            MetricsCounter.LINES_MODIFIED,
+            sum(
+                line != cleaned_line
+                for line, cleaned_line in zip(
+                    markdown.splitlines(), cleaned_markdown.splitlines(), strict=True
+                )
+            ),
+        )
+
+    return cleaned_markdown
+
+
+def _read_markdown_file_paths(stream: "BinaryIO") -> "Iterator[Path]":
+    # NOTE: Lists of files (for example from `git ls-files`) usually contain other kinds of file, which are skipped rather than rejected
+    file_path: Path
+    for file_path in utils.read_file_paths(stream):
+        if file_path.suffix != ".md":
+            logger.debug("Skipping listed file '%s': not a Markdown file", file_path)
+            continue
+
+        yield file_path
+
+
+class _PackageDescriptionGroup(click.Group):
+    """Command group whose help text is the package description, only read when displayed."""
+
+    @override
+    def format_help_text(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        import importlib.metadata  # noqa: PLC0415
+
+        self.help = f"{
+            (
+                importlib.metadata.metadata('CCFT-PyMarkdown').get('Summary')
+                or 'CCFT-PyMarkdown'
+            ).strip('.')
+        }."
+
+        super().format_help_text(ctx, formatter)
+
+
 @click.group(
+    cls=_PackageDescriptionGroup,
     context_settings={"help_option_names": ["-h", "--help"]},
-    help=f"{
-        (
-            importlib.metadata.metadata('CCFT-PyMarkdown').get('Summary') or 'CCFT-PyMarkdown'
-        ).strip('.')
-    }.",
 )
 @click.version_option(None, "-V", "--version")
 @click.option(
@@ -176,8 +298,43 @@ def _callback_dry_run(_ctx: click.Context, _param: click.Parameter, value: objec
     callback=_callback_mutually_exclusive_verbose_and_quiet,
     expose_value=False,
 )
-def run() -> None:
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help=(
+        "Path to export metrics about the run to "
+        "(files discovered, cleaned, skipped & restored, bytes read & written, "
+        "lines modified, failures by rule ID, time taken by each phase & peak memory usage)."
+    ),
+)
+@click.option(
+    "--metrics-format",
+    type=click.Choice([metrics_format.value for metrics_format in MetricsFormat]),
+    default=None,
+    help=(
+        "Format to export metrics in. "
+        "[default: json if the metrics file ends with '.json', otherwise openmetrics]"
+    ),
+)
+@click.pass_context
+def run(ctx: click.Context, *, metrics_file: Path | None, metrics_format: str | None) -> None:
     """Run cli entry-point."""
+    if metrics_file is None:
+        return
+
+    ctx.call_on_close(
+        functools.partial(
+            _write_metrics,
+            utils.metrics.start_collecting_metrics(),
+            metrics_file,
+            MetricsFormat(metrics_format)
+            if metrics_format is not None
+            else MetricsFormat.JSON
+            if metrics_file.suffix == ".json"
+            else MetricsFormat.OPENMETRICS,
+        )
+    )
 
 
 @run.command(name="clean", help="Clean custom-formatted tables from all Markdown files.")
@@ -214,14 +371,77 @@ def run() -> None:
     ),
     callback=_callback_validate_exclude_hidden,
 )
+@click.option(
+    "--include",
+    "include_patterns",
+    multiple=True,
+    metavar="GLOB",
+    help=(
+        "Only select files matching the given glob pattern (relative to the project root) "
+        "when recursing directories. Can be given multiple times."
+    ),
+)
+@click.option(
+    "--exclude",
+    "exclude_patterns",
+    multiple=True,
+    metavar="GLOB",
+    help=(
+        "Skip files & directories matching the given glob pattern "
+        "(relative to the project root) when recursing directories; "
+        "excluded directories are never searched. Can be given multiple times."
+    ),
+)
+@click.option(
+    "--files-from",
+    type=click.File("rb"),
+    metavar="FILE",
+    help=(
+        "Also clean each file listed in the given file ('-' to read from stdin), "
+        "separated by newlines or NUL characters (for example from `git ls-files -z`). "
+        "Listed files that are not Markdown files are skipped. "
+        "The list is read as a stream, so huge lists never need splitting across many runs."
+    ),
+)
+@click.option(
+    "--clean-index",
+    "clean_index_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    metavar="FILE",
+    help=(
+        "Path to an index recording which files contain custom-formatted tables "
+        "(keyed by each file's modification time & size), created if it does not exist. "
+        "Files that have not changed since the previous run are never read, nor modified, "
+        "if they contain no custom-formatted tables."
+    ),
+)
+@click.option(
+    "--output-dir",
+    "output_directory",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    metavar="DIR",
+    help=(
+        "Write cleaned copies of the files into a mirror of the project within the given "
+        "directory (for example on a tmpfs), instead of modifying the files themselves. "
+        "Files without any custom-formatted tables are linked into the mirror. "
+        "Delete the directory once finished, rather than using `restore`."
+    ),
+)
 @click.option("--dry-run/--no-dry-run", "-d/", default=False, callback=_callback_dry_run)
 @click.pass_context
-def _clean(
+def _clean(  # noqa: PLR0913
     ctx: click.Context,
     files: "Sequence[Path]",
     *,
     with_git: bool,
     exclude_hidden: bool,
+    include_patterns: "Sequence[str]",
+    exclude_patterns: "Sequence[str]",
+    files_from: "BinaryIO | None",
+    clean_index_file: Path | None,
+    output_directory: Path | None,
     dry_run: bool,
 ) -> None:
     import inflect
@@ -232,19 +452,59 @@ def _clean(
         with_git=with_git, exclude_hidden=exclude_hidden
     )
 
-    if not files:
+    path_filter: PathFilter | None = (
+        PathFilter(include_patterns, exclude_patterns)
+        if include_patterns or exclude_patterns
+        else None
+    )
+
+    if not files and files_from is None:
         logger.debug("No files explicitly selected, recursing from current working directory")
 
+    selected_files: Iterable[Path] = (
+        itertools.chain(files, _read_markdown_file_paths(files_from))
+        if files_from is not None
+        else files
+        if files
+        else utils.get_markdown_files(
+            file_exclusion_method=file_exclusion_method, path_filter=path_filter
+        )
+    )
+    clean_index: CleanIndex | None = (
+        CleanIndex(clean_index_file) if clean_index_file is not None else None
+    )
+
+    clean_tables_value_error: ValueError
+    clean_tables_file_not_found_error: FileNotFoundError
     clean_tables_file_exists_error: FileExistsError
     try:
-        cleaned_files: AbstractSet[Path] = clean(
-            files
-            if files
-            else utils.get_markdown_files(file_exclusion_method=file_exclusion_method),
-            file_exclusion_method,
-            dry_run=dry_run,
+        cleaned_files: AbstractSet[Path] = (
+            mirror_clean(
+                selected_files,
+                output_directory,
+                file_exclusion_method,
+                dry_run=dry_run,
+                path_filter=path_filter,
+                clean_index=clean_index,
+            )
+            if output_directory is not None
+            else clean(
+                selected_files,
+                file_exclusion_method,
+                dry_run=dry_run,
+                path_filter=path_filter,
+                clean_index=clean_index,
+            )
         )
 
+    except ValueError as clean_tables_value_error:
+        logger.error(str(clean_tables_value_error).strip("\n\r\t -."))  # noqa: TRY400
+        ctx.exit(2)
+
+    except FileNotFoundError as clean_tables_file_not_found_error:
+        logger.error(str(clean_tables_file_not_found_error).strip("\n\r\t -."))  # noqa: TRY400
+        ctx.exit(2)
+
     except FileExistsError as clean_tables_file_exists_error:
         logger.error(str(clean_tables_file_exists_error).strip("\n\r\t -."))  # noqa: TRY400
         logger.info(
@@ -262,19 +522,33 @@ def _clean(
             }: {', '.join(f"'{file_path}'" for file_path in cleaned_files)}"
         )
         if dry_run
-        else f"Successfully cleaned {INFLECT_ENGINE.no('file', len(cleaned_files))}",
+        else f"Successfully cleaned {INFLECT_ENGINE.no('file', len(cleaned_files))}{
+            f" into '{output_directory}'" if output_directory is not None else ''
+        }",
     )
 
 
 @run.command(name="restore", help="Restore custom-formatted tables from all Markdown files.")
 @click.version_option(None, "-V", "--version")
+@click.option(
+    "--force/--no-force",
+    default=False,
+    help=(
+        "Restore every file, even those that appear to still be in use by another running "
+        "process (for example, files left cleaned by a run that crashed on Windows, "
+        "or on another host or container sharing the same files, "
+        "where whether a process is still running cannot be checked)."
+    ),
+)
 @click.option("--dry-run/--no-dry-run", "-d/", default=False, callback=_callback_dry_run)
-def _restore(*, dry_run: bool) -> None:
+def _restore(*, force: bool, dry_run: bool) -> None:
     import inflect
 
     INFLECT_ENGINE: Final[inflect.engine] = inflect.engine()
 
-    restored_files: AbstractSet[Path] = restore(utils.get_original_files(), dry_run=dry_run)
+    restored_files: AbstractSet[Path] = restore(
+        utils.get_original_files(), dry_run=dry_run, force=force
+    )
 
     logger.info(
         "No files required restoring"
@@ -320,33 +594,319 @@ def _restore(*, dry_run: bool) -> None:
     ),
     callback=_callback_validate_exclude_hidden,
 )
+@click.option(
+    "--include",
+    "include_patterns",
+    multiple=True,
+    metavar="GLOB",
+    help=(
+        "Only select files matching the given glob pattern (relative to the project root) "
+        "when recursing directories. Can be given multiple times."
+    ),
+)
+@click.option(
+    "--exclude",
+    "exclude_patterns",
+    multiple=True,
+    metavar="GLOB",
+    help=(
+        "Skip files & directories matching the given glob pattern "
+        "(relative to the project root) when recursing directories; "
+        "excluded directories are never searched. Can be given multiple times."
+    ),
+)
+@click.option(
+    "--shard",
+    metavar="INDEX/COUNT",
+    default=None,
+    help=(
+        "Only lint the INDEX-th of COUNT shards of all Markdown files (for example '1/4'), "
+        "to split linting across multiple machines. "
+        "Shards are balanced using the costs recorded in '--timings-file', "
+        "or using file sizes when no costs have been recorded."
+    ),
+    callback=_callback_shard,
+)
+@click.option(
+    "--timings-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Path to the per-file costs, recorded by a previous run of `merge-results`, "
+        "used to balance the files within each shard."
+    ),
+)
+@click.option(
+    "--results-file",
+    type=click.File("w"),
+    default=None,
+    help="Path to export the linting results to, to be combined using `merge-results`.",
+)
+@click.option(
+    "--pipelined/--no-pipelined",
+    default=False,
+    help=(
+        "Clean, lint & restore each file one at a time, overlapping the work on each file, "
+        "so that only a few files are modified at any moment."
+    ),
+)
+@click.option(
+    "--pipeline-depth",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Maximum number of files to clean ahead of being linted, when using '--pipelined'.",
+)
+@click.option(
+    "--scan-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help=(
+        "Maximum number of seconds to spend scanning each file. "
+        "Files are scanned in a separate process, which is stopped if a file takes too long; "
+        "any files that take too long are reported as failures."
+    ),
+)
+@click.option(
+    "--report-slowest",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Report the given number of files that took the longest to scan. "
+        "Note: the time taken to scan each file is estimated from its size, "
+        "unless using '--scan-batch-size 1'."
+    ),
+)
+@click.option(
+    "--scan-batch-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SCAN_BATCH_SIZE,
+    show_default=True,
+    help=(
+        "Maximum number of files to lint within each single run of PyMarkdown. "
+        "Files are always linted one at a time when using '--pipelined' or '--scan-timeout'."
+    ),
+)
+@click.option(
+    "--fail-fast/--no-fail-fast",
+    default=False,
+    help=(
+        "Stop linting as soon as any failures are found, "
+        "restoring only the files that have already been cleaned. "
+        "Combine with '--pipelined' to also stop cleaning any further files."
+    ),
+)
+@click.option(
+    "--from-index",
+    is_flag=True,
+    default=False,
+    help=(
+        "Lint the staged contents of each Markdown file, read directly from git, "
+        "instead of the contents within the working tree (which is left untouched). "
+        "Note: '--from-index' is not available when the [git-python] extra is not installed."
+    ),
+    callback=_callback_validate_read_from_git,
+)
+@click.option(
+    "--rev",
+    metavar="REF",
+    default=None,
+    help=(
+        "Lint the contents of each Markdown file at the given git revision, "
+        "instead of the contents within the working tree (which is left untouched). "
+        "Note: '--rev' is not available when the [git-python] extra is not installed."
+    ),
+    callback=_callback_validate_read_from_git,
+)
+@click.option(
+    "--files-from",
+    type=click.File("rb"),
+    metavar="FILE",
+    help=(
+        "Only lint the files listed in the given file ('-' to read from stdin), "
+        "separated by newlines or NUL characters (for example from `git ls-files -z`), "
+        "instead of searching for Markdown files "
+        "(listed files that are not Markdown files are skipped). "
+        "The list is read as a stream, so with '--pipelined' linting starts straight away."
+    ),
+)
+@click.option(
+    "--clean-index",
+    "clean_index_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    metavar="FILE",
+    help=(
+        "Path to an index recording which files contain custom-formatted tables "
+        "(keyed by each file's modification time & size), created if it does not exist. "
+        "Files that have not changed since the previous run are never read, nor modified, "
+        "if they contain no custom-formatted tables. "
+        "Note: '--clean-index' is not available when using '--pipelined'."
+    ),
+)
+@click.option(
+    "--verify-restore/--no-verify-restore",
+    default=False,
+    help=(
+        "Check that every cleaned file exactly matches its original contents "
+        "after it has been restored, exiting with an error if any file does not. "
+        "Only the cleaned files are re-read, in parallel. "
+        "Note: '--verify-restore' is not available when using '--pipelined'."
+    ),
+)
 @click.pass_context
-def _scan_all(ctx: click.Context, *, with_git: bool, exclude_hidden: bool) -> None:
+def _scan_all(  # noqa: PLR0912, PLR0913, PLR0915
+    ctx: click.Context,
+    *,
+    with_git: bool,
+    exclude_hidden: bool,
+    include_patterns: "Sequence[str]",
+    exclude_patterns: "Sequence[str]",
+    shard: tuple[int, int] | None,
+    timings_file: Path | None,
+    results_file: "TextIO | None",
+    pipelined: bool,
+    pipeline_depth: int,
+    scan_timeout: float | None,
+    report_slowest: int | None,
+    scan_batch_size: int,
+    fail_fast: bool,
+    from_index: bool,
+    rev: str | None,
+    files_from: "BinaryIO | None",
+    clean_index_file: Path | None,
+    verify_restore: bool,
+) -> None:
+    from pymarkdown.api import PyMarkdownApiException  # noqa: PLC0415
+
+    if from_index and rev is not None:
+        raise click.BadOptionUsage(
+            option_name="from-index",
+            message="Cannot use '--from-index' in addition to '--rev'.",
+            ctx=ctx,
+        )
+
+    if pipelined and (from_index or rev is not None):
+        raise click.BadOptionUsage(
+            option_name="pipelined",
+            message=(
+                "Cannot use '--pipelined' when reading files from git, "
+                "because the working tree is not modified."
+            ),
+            ctx=ctx,
+        )
+
+    if pipelined and (clean_index_file is not None or verify_restore):
+        raise click.BadOptionUsage(
+            option_name="pipelined",
+            message=("Cannot use '--pipelined' with '--clean-index' or '--verify-restore'."),
+            ctx=ctx,
+        )
+
+    file_exclusion_method: FileExclusionMethod = FileExclusionMethod.from_flags(
+        with_git=with_git, exclude_hidden=exclude_hidden
+    )
+
+    path_filter: PathFilter | None = (
+        PathFilter(include_patterns, exclude_patterns)
+        if include_patterns or exclude_patterns
+        else None
+    )
+
+    git_blob_reader: GitBlobReader | None = None
+    if from_index or rev is not None:
+        try:
+            git_blob_reader = GitBlobReader(rev, path_filter=path_filter)
+        except ValueError as git_blob_reader_error:
+            logger.error(str(git_blob_reader_error).strip("\n\r\t -."))  # noqa: TRY400
+            ctx.exit(2)
+
+        ctx.call_on_close(git_blob_reader.close)
+
+    files: Iterable[Path] | None = (
+        _read_markdown_file_paths(files_from) if files_from is not None else None
+    )
+    if shard is not None:
+        files = select_shard(
+            files
+            if files is not None
+            else git_blob_reader.markdown_files
+            if git_blob_reader is not None
+            else utils.get_markdown_files(
+                file_exclusion_method=file_exclusion_method, path_filter=path_filter
+            ),
+            *shard,
+            load_file_costs(timings_file) if timings_file is not None else None,
+        )
+
+    scanner: Scanner = Scanner(create_pymarkdown_api(), scan_timeout=scan_timeout)
+    ctx.call_on_close(scanner.close)
+
+    mismatched_files_count: int = 0
+
+    clean_tables_value_error: ValueError
+    clean_tables_file_not_found_error: FileNotFoundError
     clean_tables_file_exists_error: FileExistsError
     try:
-        with CleanCustomFormattedTables(
-            file_exclusion_method=FileExclusionMethod.from_flags(
-                with_git=with_git, exclude_hidden=exclude_hidden
-            )
-        ) as custom_formatted_tables_cleaner:
-            if not custom_formatted_tables_cleaner.cleaned_files:
-                logger.info("No files to lint")
-                return
-
-            scanner: Scanner = Scanner(
-                PyMarkdownApi(inherit_logging=False)
-                .log_error_and_above()
-                .enable_strict_configuration()
-            )
-
-            file_path: Path
-            for file_path in custom_formatted_tables_cleaner.cleaned_files:
-                scanner.scan_file_path(file_path)
+        file_path: Path
+        if git_blob_reader is not None:
+            markdown: str
+            for file_path, markdown in git_blob_reader.iter_read(files):
+                scanner.scan_string(_clean_markdown_from_git(markdown), file_path)
+
+                if fail_fast and scanner.encountered_failures:
+                    break
+
+        elif pipelined:
+            pipelined_cleaned_files: Generator[Path]
+            with contextlib.closing(
+                pipelined_clean(
+                    files
+                    if files is not None
+                    else utils.get_markdown_files(
+                        file_exclusion_method=file_exclusion_method, path_filter=path_filter
+                    ),
+                    file_exclusion_method,
+                    max_pending_files=pipeline_depth,
+                    path_filter=path_filter,
+                )
+            ) as pipelined_cleaned_files:
+                for file_path in pipelined_cleaned_files:
+                    scanner.scan_file_path(file_path)
+
+                    # NOTE: Closing the pipeline cancels any further cleaning, then restores only the files that have already been cleaned
+                    if fail_fast and scanner.encountered_failures:
+                        break
+
+        else:
+            with CleanCustomFormattedTables(
+                files,
+                file_exclusion_method,
+                path_filter=path_filter,
+                index_file=clean_index_file,
+                verify_restore=verify_restore,
+            ) as custom_formatted_tables_cleaner:
+                scanner.scan_file_paths(
+                    sorted(custom_formatted_tables_cleaner.cleaned_files),
+                    batch_size=scan_batch_size,
+                    fail_fast=fail_fast,
+                )
+
+            if verify_restore:
+                mismatched_files_count = len(custom_formatted_tables_cleaner.mismatched_files)
 
     except PyMarkdownApiException as pymarkdownlnt_error:
         logger.error(str(pymarkdownlnt_error).strip("\n\r\t -."))  # noqa: TRY400
         ctx.exit(2)
 
+    except ValueError as clean_tables_value_error:
+        logger.error(str(clean_tables_value_error).strip("\n\r\t -."))  # noqa: TRY400
+        ctx.exit(2)
+
+    except FileNotFoundError as clean_tables_file_not_found_error:
+        logger.error(str(clean_tables_file_not_found_error).strip("\n\r\t -."))  # noqa: TRY400
+        ctx.exit(2)
+
     except FileExistsError as clean_tables_file_exists_error:
         logger.error(str(clean_tables_file_exists_error).strip("\n\r\t -."))  # noqa: TRY400
         logger.info(
@@ -355,6 +915,63 @@ def _scan_all(ctx: click.Context, *, with_git: bool, exclude_hidden: bool) -> No
         )
         ctx.exit(2)
 
+    utils.metrics.record_failures(scanner.get_failure_counts())
+
+    if not scanner.file_costs:
+        logger.info("No files to lint")
+
+    if results_file is not None:
+        scanner.write_results(results_file)
+
+    if report_slowest is not None:
+        scanner.log_slowest_files(report_slowest)
+
+    scanner.log_errors()
+
+    if mismatched_files_count:
+        logger.error(
+            "%d restored files did not match their original contents", mismatched_files_count
+        )
+        ctx.exit(2)
+
+    if scanner.encountered_failures:
+        ctx.exit(1)
+
+
+@run.command(
+    name="merge-results",
+    help="Combine the linting results exported by each shard of `scan-all` into one report.",
+)
+@click.version_option(None, "-V", "--version")
+@click.argument("results_files", nargs=-1, required=True, type=click.File("r"))
+@click.option(
+    "--timings-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Path to store the combined per-file costs, "
+        "to balance the shards of future runs of `scan-all`."
+    ),
+)
+@click.pass_context
+def _merge_results(
+    ctx: click.Context, results_files: "Sequence[TextIO]", *, timings_file: Path | None
+) -> None:
+    scanner: Scanner = Scanner()
+
+    results_file: TextIO
+    for results_file in results_files:
+        try:
+            scanner.read_results(results_file)
+        except ValueError as invalid_results_file_error:
+            logger.error(str(invalid_results_file_error).strip("\n\r\t -."))  # noqa: TRY400
+            ctx.exit(2)
+
+    if timings_file is not None:
+        save_file_costs(timings_file, scanner.file_costs)
+
+    utils.metrics.record_failures(scanner.get_failure_counts())
+
     scanner.log_errors()
     if scanner.encountered_failures:
         ctx.exit(1)
@@ -1,24 +1,45 @@
 """Custom context manager to clean custom-formatted tables only inside the context."""
 
+import logging
 from typing import TYPE_CHECKING
 
+from . import _ownership as ownership
 from . import utils
 from ._clean import clean
+from ._clean_index import CleanIndex
 from ._restore import restore
-from .utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod
+from ._verify import find_mismatched_files
+from .utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod, metrics
+from .utils.metrics import MetricsCounter
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
     from collections.abc import Set as AbstractSet
+    from logging import Logger
     from pathlib import Path
     from types import TracebackType
     from typing import Final, Self
 
+    from ._path_filter import PathFilter
+
 __all__: "Sequence[str]" = ("CleanCustomFormattedTables",)
 
+logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
+
 
 class CleanCustomFormattedTables:
-    """Context manager to clean custom-formatted tables only inside the context."""
+    """
+    Context manager to clean custom-formatted tables only inside the context.
+
+    A reusable context manager can be entered many times.
+    It discovers the selected files only once, never modifies files without any
+    custom-formatted tables, and only re-reads files whose modification time or size
+    has changed since the last entry.
+    If an index file is given, which files need cleaning is also recorded in that file,
+    so unchanged files are not re-read by later runs either.
+    If restoring is verified, each file cleaned by this context manager is checked
+    to exactly match its original contents after it has been restored.
+    """
 
     def __init__(
         self,
@@ -26,27 +47,103 @@ class CleanCustomFormattedTables:
         file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
         *,
         skip_errors: bool = False,
+        reusable: bool = False,
+        path_filter: "PathFilter | None" = None,
+        index_file: "Path | None" = None,
+        verify_restore: bool = False,
     ) -> None:
         """Initialise the context manager with the given selected files to clean."""
         self.skip_errors: bool = skip_errors
+        self.verify_restore: bool = verify_restore
         self.file_exclusion_method: FileExclusionMethod = file_exclusion_method
+        self.reusable: bool = reusable
+        self.path_filter: PathFilter | None = path_filter
         self.files: Iterable[Path] = (
             files
             if files is not None
-            else utils.get_markdown_files(file_exclusion_method=file_exclusion_method)
+            else utils.get_markdown_files(
+                file_exclusion_method=file_exclusion_method, path_filter=path_filter
+            )
         )
+        if reusable:
+            self.files = self._discover_files(self.files)
+
+        self._owner_id: str = ownership.create_owner_id()
+        self._clean_index: CleanIndex = CleanIndex(index_file)
+        self._modified_files: AbstractSet[Path] | None = None
         self._cleaned_files: AbstractSet[Path] | None = None
         self._restored_files: AbstractSet[Path] | None = None
+        self._original_hashes: dict[Path, str] | None = None
+        self._mismatched_files: Sequence[Path] | None = None
+
+    def _discover_files(self, files: "Iterable[Path]") -> "Sequence[Path]":
+        discovered_files: dict[Path, None] = {}
+
+        file_path: Path
+        for file_path in files:
+            if file_path.is_dir():
+                discovered_files.update(
+                    dict.fromkeys(
+                        utils.get_markdown_files(
+                            file_path, self.file_exclusion_method, self.path_filter
+                        )
+                    )
+                )
+                continue
+
+            discovered_files[file_path] = None
+
+        return tuple(discovered_files)
 
     def __enter__(self) -> "Self":
         """Clean custom-formatted tables before entering the context."""
-        self._cleaned_files = clean(
-            self.files,
+        self._original_hashes = {} if self.verify_restore else None
+
+        if not self.reusable and self._clean_index.index_file_path is None:
+            self._modified_files = clean(
+                self.files,
+                self.file_exclusion_method,
+                skip_errors=self.skip_errors,
+                owner_id=self._owner_id,
+                path_filter=self.path_filter,
+                original_hashes=self._original_hashes,
+            )
+            self._cleaned_files = self._modified_files
+        else:
+            self._clean_files_needing_cleaning()
+
+        return self
+
+    def _clean_files_needing_cleaning(self) -> None:
+        files_to_clean: list[Path] = []
+        unmodified_files: set[Path] = set()
+
+        with metrics.time_phase("clean"):
+            file_path: Path
+            for file_path in self.files if self.reusable else self._discover_files(self.files):
+                if self._clean_index.needs_cleaning(file_path):
+                    files_to_clean.append(file_path)
+                else:
+                    unmodified_files.add(file_path)
+                    metrics.increment_metric(MetricsCounter.FILES_DISCOVERED)
+                    metrics.increment_metric(MetricsCounter.FILES_SKIPPED)
+
+            self._clean_index.save()
+
+        logger.debug(
+            "Skipping cleaning %d files that contain no custom-formatted tables",
+            len(unmodified_files),
+        )
+
+        self._modified_files = clean(
+            files_to_clean,
             self.file_exclusion_method,
             skip_errors=self.skip_errors,
+            owner_id=self._owner_id,
+            path_filter=self.path_filter,
+            original_hashes=self._original_hashes,
         )
-
-        return self
+        self._cleaned_files = unmodified_files | self._modified_files
 
     def __exit__(
         self,
@@ -56,9 +153,60 @@ class CleanCustomFormattedTables:
     ) -> None:
         """Restore Markdown files back to their original state."""
         self._restored_files = restore(
-            file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
-            for file_path in self.cleaned_files
+            (
+                file_path.parent / f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
+                for file_path in (
+                    self._modified_files
+                    if self._modified_files is not None
+                    else self.cleaned_files
+                )
+            ),
+            owner_id=self._owner_id,
+        )
+
+        if self._original_hashes is None:
+            return
+
+        # NOTE: Files still held by other running processes are left cleaned, so cannot yet be verified
+        self._mismatched_files = find_mismatched_files(
+            {
+                file_path: original_hash
+                for file_path, original_hash in self._original_hashes.items()
+                if not file_path.with_name(
+                    f"{file_path.name}{CONVERSION_FILE_SUFFIX}"
+                ).exists()
+            }
         )
+        self._original_hashes = None
+
+        mismatched_file_path: Path
+        for mismatched_file_path in self._mismatched_files:
+            logger.error(
+                "File '%s' was not restored to its original contents", mismatched_file_path
+            )
+
+    @property
+    def modified_files(self) -> "AbstractSet[Path]":
+        """Retrieve the files modified (rather than only selected) by entering the context."""
+        if self._modified_files is None:
+            CANNOT_VIEW_MESSAGE: Final[str] = (
+                "Cannot view 'modified_files' until the context manager has been entered."
+            )
+            raise RuntimeError(CANNOT_VIEW_MESSAGE)
+
+        return self._modified_files
+
+    @property
+    def mismatched_files(self) -> "Sequence[Path]":
+        """Retrieve the files that did not match their original contents after restoring."""
+        if self._mismatched_files is None:
+            CANNOT_VIEW_MESSAGE: Final[str] = (
+                "Cannot view 'mismatched_files' until the context manager has been exited "
+                "with restoring verified."
+            )
+            raise RuntimeError(CANNOT_VIEW_MESSAGE)
+
+        return self._mismatched_files
 
     @property
     def cleaned_files(self) -> "AbstractSet[Path]":
@@ -1,27 +1,38 @@
 """Common utils made available for use throughout this project."""
 
+import functools
+import io
 import logging
+import os
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
-from . import click_logging
-from .click_logging import setup_logging
+from . import metrics
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from logging import Logger
-    from typing import Final
+    from typing import BinaryIO, Final
 
     from git import PathLike
 
+    from ccft_pymarkdown._path_filter import PathFilter
+
+    from .click_logging import setup_logging, shutdown_logging
+
+    PROJECT_ROOT: Path
+
 __all__: "Sequence[str]" = (
     "PROJECT_ROOT",
     "FileExclusionMethod",
     "format_exception_to_log_message",
     "get_all_markdown_files",
     "get_all_original_files",
+    "get_project_root",
+    "read_file_paths",
     "setup_logging",
+    "shutdown_logging",
 )
 
 
@@ -29,6 +40,9 @@ logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
 logger.disabled = True
 
 CONVERSION_FILE_SUFFIX: "Final[str]" = ".ccft-original"
+LOCK_FILE_SUFFIX: "Final[str]" = ".ccft-lock"
+HOLDERS_FILE_SUFFIX: "Final[str]" = ".ccft-holders"
+FILE_PATHS_CHUNK_SIZE: "Final[int]" = 64 * 1024
 
 
 class FileExclusionMethod(Enum):
@@ -93,21 +107,86 @@ def _get_readme_root() -> "Path":
     raise FileNotFoundError(NO_ROOT_DIRECTORY_MESSAGE)
 
 
-PROJECT_ROOT: "Final[Path]" = _get_project_root()
+@functools.cache
+def get_project_root() -> "Path":
+    """
+    Locate the root directory of the current project, from the current working directory.
+
+    The root is only located when first needed (rather than when this package is imported),
+    so that importing this package never requires a project directory, nor GitPython.
+    """
+    return _get_project_root()
+
 
+def __getattr__(name: str) -> object:
+    if name == "PROJECT_ROOT":
+        return get_project_root()
 
-def _manual_check_hidden(file_path: "Path") -> bool:
-    is_hidden: bool = file_path.stem.startswith(".") or any(
-        parent.name.startswith(".") for parent in file_path.parents
-    )
+    if name in ("setup_logging", "shutdown_logging"):
+        from . import click_logging  # noqa: PLC0415
+
+        return getattr(click_logging, name)
+
+    NO_ATTRIBUTE_MESSAGE: Final[str] = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(NO_ATTRIBUTE_MESSAGE)
+
+
+def _walk_markdown_files(
+    root: "Path", *, exclude_hidden: bool, path_filter: "PathFilter | None"
+) -> "Iterator[Path]":
+    raw_directory_path: str
+    directory_names: list[str]
+    file_names: list[str]
+    for raw_directory_path, directory_names, file_names in os.walk(root):
+        directory_path: Path = Path(raw_directory_path)
+
+        # NOTE: Excluded directories are removed in-place, so that the walk never descends into them
+        directory_names[:] = [
+            directory_name
+            for directory_name in directory_names
+            if not _is_excluded_directory(
+                directory_path / directory_name,
+                exclude_hidden=exclude_hidden,
+                path_filter=path_filter,
+            )
+        ]
+
+        file_name: str
+        for file_name in file_names:
+            file_path: Path = directory_path / file_name
+
+            if file_path.suffix != ".md":
+                continue
+
+            if exclude_hidden and file_path.stem.startswith("."):
+                logger.debug("File %s is hidden", file_path)
+                continue
+
+            if path_filter is not None and not path_filter.matches(file_path):
+                continue
+
+            yield file_path
+
+
+def _is_excluded_directory(
+    directory_path: "Path", *, exclude_hidden: bool, path_filter: "PathFilter | None"
+) -> bool:
+    if exclude_hidden and directory_path.name.startswith("."):
+        logger.debug("Directory %s is hidden", directory_path)
+        return True
 
-    if is_hidden:
-        logger.debug("File %s is hidden", file_path)
+    if path_filter is not None and path_filter.is_excluded_directory(directory_path):
+        logger.debug("Directory %s is excluded", directory_path)
+        return True
 
-    return is_hidden
+    return False
 
 
-def _naive_get_markdown_files(root: "Path", *, exclude_hidden: bool) -> "Iterable[Path]":
+def _naive_get_markdown_files(
+    root: "Path", *, exclude_hidden: bool, path_filter: "PathFilter | None"
+) -> "Iterable[Path]":
+    from . import click_logging  # noqa: PLC0415
+
     if exclude_hidden and not click_logging.LOGGED_USE_GIT_PYTHON:
         click_logging.LOGGED_USE_GIT_PYTHON = True
         logger.warning(
@@ -118,22 +197,34 @@ def _naive_get_markdown_files(root: "Path", *, exclude_hidden: bool) -> "Iterabl
             "and provide the path to a git repository"
         )
 
-    return (
-        file_path
-        for file_path in root.rglob("*.md")
-        if not exclude_hidden or not _manual_check_hidden(file_path.relative_to(root))
-    )
+    return _walk_markdown_files(root, exclude_hidden=exclude_hidden, path_filter=path_filter)
 
 
 def get_markdown_files(
-    root: "Path" = PROJECT_ROOT,
+    root: "Path | None" = None,
     file_exclusion_method: FileExclusionMethod = FileExclusionMethod.WITH_GIT,
+    path_filter: "PathFilter | None" = None,
 ) -> "Iterable[Path]":
     """
     Retrieve all Markdown files under the root path that may require cleaning.
 
-    Files are excluded based on the 'file_exclusion_method'.
+    Files are excluded based on the 'file_exclusion_method',
+    and any given path filter (without descending into excluded directories).
+    The root path defaults to the root directory of the current project.
     """
+    return metrics.time_iter(
+        _get_markdown_files(
+            root if root is not None else get_project_root(),
+            file_exclusion_method,
+            path_filter,
+        ),
+        "discover",
+    )
+
+
+def _get_markdown_files(
+    root: "Path", file_exclusion_method: FileExclusionMethod, path_filter: "PathFilter | None"
+) -> "Iterable[Path]":
     if not root.is_dir():
         raise NotADirectoryError(root)
 
@@ -141,6 +232,7 @@ def get_markdown_files(
         return _naive_get_markdown_files(
             root,
             exclude_hidden=file_exclusion_method is FileExclusionMethod.MANUAL_EXCLUSION_RULES,
+            path_filter=path_filter,
         )
 
     try:
@@ -153,13 +245,13 @@ def get_markdown_files(
             ),
             root,
         )
-        return _naive_get_markdown_files(root, exclude_hidden=True)
+        return _naive_get_markdown_files(root, exclude_hidden=True, path_filter=path_filter)
 
     try:
         repo_root: Repo = Repo(root)
     except InvalidGitRepositoryError:
         logger.debug("Path '%s' is not a git repository, using naive file exploration", root)
-        return _naive_get_markdown_files(root, exclude_hidden=True)
+        return _naive_get_markdown_files(root, exclude_hidden=True, path_filter=path_filter)
 
     logger.debug("Using git for file exploration of directory '%s'", root)
 
@@ -167,15 +259,65 @@ def get_markdown_files(
         file_path
         for file_entry in repo_root.index.entries
         if (file_path := root / file_entry[0]).suffix == ".md"
+        and (path_filter is None or path_filter.matches(file_path))
     )
 
 
-def get_original_files(root: "Path" = PROJECT_ROOT) -> "Iterable[Path]":
+def get_original_files(root: "Path | None" = None) -> "Iterable[Path]":
     """Retreive all previously saved original files that require restoration."""
+    if root is None:
+        root = get_project_root()
+
     if not root.is_dir():
         raise NotADirectoryError(root)
 
-    return root.rglob(f"*{CONVERSION_FILE_SUFFIX}")
+    return metrics.time_iter(root.rglob(f"*{CONVERSION_FILE_SUFFIX}"), "discover")
+
+
+def _decode_file_paths(
+    raw_file_paths: "Iterable[bytes]", separator: bytes
+) -> "Iterator[Path]":
+    raw_file_path: bytes
+    for raw_file_path in raw_file_paths:
+        stripped_raw_file_path: bytes = (
+            raw_file_path.removesuffix(b"\r") if separator == b"\n" else raw_file_path
+        )
+        if stripped_raw_file_path:
+            yield Path(os.fsdecode(stripped_raw_file_path))
+
+
+def read_file_paths(stream: "BinaryIO") -> "Iterator[Path]":
+    """
+    Read the newline or NUL separated file paths from the given stream, one at a time.
+
+    Each path is yielded as soon as it has been read, before the rest of the stream arrives.
+    Paths are separated by NUL characters if one has been read by the time that the first
+    separator (either a NUL character or a newline) arrives.
+    """
+    # NOTE: Buffered streams return whatever is already available, rather than blocking until a whole chunk has arrived
+    read_chunk: Callable[[int], bytes] = (
+        stream.read1 if isinstance(stream, io.BufferedIOBase) else stream.read
+    )
+
+    separator: bytes | None = None
+    remaining_raw_file_path: bytes = b""
+    while chunk := read_chunk(FILE_PATHS_CHUNK_SIZE):
+        remaining_raw_file_path += chunk
+
+        # NOTE: A streaming producer can deliver a partial first path without any separator, so the separator is only chosen once one has been read
+        if separator is None:
+            if b"\0" in chunk:
+                separator = b"\0"
+            elif b"\n" in chunk:
+                separator = b"\n"
+            else:
+                continue
+
+        raw_file_paths: list[bytes] = remaining_raw_file_path.split(separator)
+        remaining_raw_file_path = raw_file_paths.pop()
+        yield from _decode_file_paths(raw_file_paths, separator)
+
+    yield from _decode_file_paths((remaining_raw_file_path,), separator or b"\n")
 
 
 def format_exception_to_log_message(exception: Exception) -> str:
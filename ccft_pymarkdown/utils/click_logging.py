@@ -1,6 +1,12 @@
 """Logging setup for use in combination with the click framework."""
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+import sys
+import threading
 from typing import TYPE_CHECKING, override
 
 import click
@@ -14,8 +20,11 @@ if TYPE_CHECKING:
 __all__: "Sequence[str]" = (
     "LOGGED_USE_GIT_PYTHON",
     "ClickHandler",
+    "ClickWriterThread",
     "ColourFormatter",
+    "QueuedClickHandler",
     "setup_logging",
+    "shutdown_logging",
 )
 
 
@@ -23,15 +32,28 @@ logger: "Final[Logger]" = logging.getLogger("ccft_pymarkdown")
 
 LOGGED_USE_GIT_PYTHON: bool = False
 
+_MAX_BATCH_SIZE: "Final[int]" = 256
+
 
 class ColourFormatter(logging.Formatter):
     """Simple log message formatter that applies click's colour styling."""
 
     @override
-    def format(self, record: logging.LogRecord) -> str:
-        if not record.exc_info:
-            PREFIX: Final[str] = click.style(
-                f"{record.levelname.upper()}: ",
+    def __init__(self, *, colour: bool = True) -> None:
+        super().__init__()
+
+        self.colour: bool = colour
+        self._prefixes: dict[tuple[int, str], str] = {}
+
+    def _get_prefix(self, record: logging.LogRecord) -> str:
+        prefix: str | None = self._prefixes.get((record.levelno, record.levelname))
+        if prefix is not None:
+            return prefix
+
+        prefix = f"{record.levelname.upper()}: "
+        if self.colour:
+            prefix = click.style(
+                prefix,
                 fg=(
                     "red"
                     if record.levelno >= logging.ERROR
@@ -40,7 +62,20 @@ class ColourFormatter(logging.Formatter):
                     else "blue"
                 ),
             )
-            return "\n".join(f"{PREFIX}{line}" for line in super().format(record).splitlines())
+
+        self._prefixes[(record.levelno, record.levelname)] = prefix
+        return prefix
+
+    @override
+    def format(self, record: logging.LogRecord) -> str:
+        if not record.exc_info:
+            PREFIX: Final[str] = self._get_prefix(record)
+            message: str = super().format(record)
+
+            if "\n" not in message:
+                return f"{PREFIX}{message}"
+
+            return "\n".join(f"{PREFIX}{line}" for line in message.splitlines())
 
         return super().format(record)
 
@@ -56,14 +91,114 @@ class ClickHandler(logging.Handler):
             self.handleError(record)
             return
 
+    def emit_batch(self, records: "Sequence[logging.LogRecord]") -> None:
+        """Export many log messages using a single click echo."""
+        if not records:
+            return
+
+        try:
+            click.echo("\n".join(self.format(record) for record in records), err=True)
+        except Exception:  # noqa: BLE001
+            self.handleError(records[-1])
+            return
+
+
+class QueuedClickHandler(logging.handlers.QueueHandler):
+    """Logging handler that passes log records to a background thread to be exported."""
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # NOTE: Only the message arguments are resolved straight away (in case they are later changed), all other formatting is left to the background thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class ClickWriterThread(threading.Thread):
+    """Background thread that exports queued log records, in batches, as click echos."""
+
+    @override
+    def __init__(
+        self,
+        records_queue: "queue.SimpleQueue[logging.LogRecord | None]",
+        handler: ClickHandler,
+    ) -> None:
+        super().__init__(name="ccft-pymarkdown-logging", daemon=True)
+
+        self.records_queue: queue.SimpleQueue[logging.LogRecord | None] = records_queue
+        self.handler: ClickHandler = handler
+
+    @override
+    def run(self) -> None:
+        while True:
+            records: list[logging.LogRecord] = []
+            stop: bool = False
+
+            record: logging.LogRecord | None = self.records_queue.get()
+            while True:
+                if record is None:
+                    stop = True
+                    break
+
+                records.append(record)
+                if len(records) >= _MAX_BATCH_SIZE:
+                    break
+
+                try:
+                    record = self.records_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self.handler.emit_batch(records)
+
+            if stop:
+                return
+
+    def stop(self) -> None:
+        """Export all remaining queued log records, then stop the thread."""
+        self.records_queue.put(None)
+        self.join()
+
+
+_writer_thread: ClickWriterThread | None = None
+
+
+def _create_click_handler() -> ClickHandler:
+    click_handler: ClickHandler = ClickHandler()
+    click_handler.formatter = ColourFormatter(colour=sys.stderr.isatty())
+    return click_handler
+
+
+def shutdown_logging() -> None:
+    """Export all remaining queued log messages, then continue logging without a queue."""
+    global _writer_thread  # noqa: PLW0603
+
+    if _writer_thread is None:
+        return
+
+    _writer_thread.stop()
+    _writer_thread = None
+
+    logger.handlers = [_create_click_handler()]
+
 
 def setup_logging(verbosity: int) -> None:
     """Set up logging using click's echo messaging at the given verbosity."""
+    global _writer_thread  # noqa: PLW0603
+
+    shutdown_logging()
+
     logger.disabled = False
     logger.setLevel(
         logging.DEBUG if verbosity > 0 else logging.INFO if verbosity == 0 else logging.WARNING
     )
     logger.propagate = False
-    click_handler: logging.Handler = ClickHandler()
-    click_handler.formatter = ColourFormatter()
-    logger.handlers = [click_handler]
+
+    records_queue: queue.SimpleQueue[logging.LogRecord | None] = queue.SimpleQueue()
+    _writer_thread = ClickWriterThread(records_queue, _create_click_handler())
+    _writer_thread.start()
+    logger.handlers = [QueuedClickHandler(records_queue)]
+
+
+atexit.register(shutdown_logging)
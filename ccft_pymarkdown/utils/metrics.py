@@ -0,0 +1,232 @@
+"""Collection & export of machine-readable metrics about each run."""
+
+import contextlib
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+    from typing import Final, TextIO
+
+
+__all__: "Sequence[str]" = (
+    "Metrics",
+    "MetricsCounter",
+    "MetricsFormat",
+    "increment_metric",
+    "record_failures",
+    "start_collecting_metrics",
+    "stop_collecting_metrics",
+    "time_iter",
+    "time_phase",
+)
+
+
+class MetricsCounter(Enum):
+    """Choice of counted quantities, recorded while cleaning, restoring & scanning files."""
+
+    FILES_DISCOVERED = "files_discovered"
+    FILES_CLEANED = "files_cleaned"
+    FILES_SKIPPED = "files_skipped"
+    FILES_RESTORED = "files_restored"
+    BYTES_READ = "bytes_read"
+    BYTES_WRITTEN = "bytes_written"
+    LINES_MODIFIED = "lines_modified"
+
+
+class MetricsFormat(Enum):
+    """Choice of file formats to export metrics as."""
+
+    JSON = "json"
+    OPENMETRICS = "openmetrics"
+
+
+def _get_peak_rss() -> "Mapping[str, int]":
+    # NOTE: The resource module is not available on Windows, so no peak memory usage is reported
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return {}
+
+    # NOTE: Peak memory usage is reported in kilobytes on Linux, but in bytes on macOS
+    RSS_UNIT: Final[int] = 1 if sys.platform == "darwin" else 1024
+
+    return {
+        "main": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * RSS_UNIT,
+    }
+
+
+def _escape_label_value(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Thread-safe collection of the counts & timings recorded during a single run."""
+
+    def __init__(self) -> None:
+        """Start the wall-clock timer for the whole run."""
+        self._lock: threading.Lock = threading.Lock()
+        self._start_time: float = time.perf_counter()
+        self.counters: Counter[MetricsCounter] = Counter(dict.fromkeys(MetricsCounter, 0))
+        self.failures_by_rule: Counter[str] = Counter()
+        self.phase_times: dict[str, float] = {}
+
+    def increment(self, counter: MetricsCounter, amount: int = 1) -> None:
+        """Add the given amount to the given counted quantity."""
+        with self._lock:
+            self.counters[counter] += amount
+
+    def add_phase_time(self, phase: str, duration: float) -> None:
+        """Add the given number of seconds to the time spent within the given phase."""
+        with self._lock:
+            self.phase_times[phase] = self.phase_times.get(phase, 0) + duration
+
+    def record_failures(self, failures_by_rule: "Mapping[str, int]") -> None:
+        """Add the given number of failures, found for each rule ID."""
+        with self._lock:
+            self.failures_by_rule.update(failures_by_rule)
+
+    def _get_phase_times(self) -> "Mapping[str, float]":
+        with self._lock:
+            return {**self.phase_times, "total": time.perf_counter() - self._start_time}
+
+    def to_dict(self) -> "Mapping[str, object]":
+        """Retrieve all the collected metrics, in a JSON-serialisable form."""
+        with self._lock:
+            raw_metrics: dict[str, object] = {
+                counter.value: count for counter, count in self.counters.items()
+            }
+            raw_metrics["failures_by_rule"] = dict(sorted(self.failures_by_rule.items()))
+
+        raw_metrics["phase_seconds"] = self._get_phase_times()
+        raw_metrics["peak_rss_bytes"] = _get_peak_rss()
+        return raw_metrics
+
+    def write_json(self, metrics_file: "TextIO") -> None:
+        """Export all the collected metrics as JSON."""
+        json.dump(self.to_dict(), metrics_file, indent=2)
+        metrics_file.write("\n")
+
+    def write_openmetrics(self, metrics_file: "TextIO") -> None:
+        """Export all the collected metrics in the OpenMetrics text format."""
+        with self._lock:
+            counters: Mapping[MetricsCounter, int] = dict(self.counters)
+            failures_by_rule: Mapping[str, int] = dict(sorted(self.failures_by_rule.items()))
+
+        counter: MetricsCounter
+        for counter in MetricsCounter:
+            metric_name: str = f"ccft_pymarkdown_{counter.value}"
+            metrics_file.write(f"# TYPE {metric_name} counter\n")
+            metrics_file.write(f"{metric_name}_total {counters[counter]}\n")
+
+        metrics_file.write("# TYPE ccft_pymarkdown_failures counter\n")
+        rule_id: str
+        failure_count: int
+        for rule_id, failure_count in failures_by_rule.items():
+            metrics_file.write(
+                "ccft_pymarkdown_failures_total"
+                f'{{rule_id="{_escape_label_value(rule_id)}"}} {failure_count}\n'
+            )
+
+        metrics_file.write("# TYPE ccft_pymarkdown_phase_duration_seconds gauge\n")
+        phase: str
+        duration: float
+        for phase, duration in self._get_phase_times().items():
+            metrics_file.write(
+                "ccft_pymarkdown_phase_duration_seconds"
+                f'{{phase="{_escape_label_value(phase)}"}} {duration:.6f}\n'
+            )
+
+        peak_rss: Mapping[str, int] = _get_peak_rss()
+        if peak_rss:
+            metrics_file.write("# TYPE ccft_pymarkdown_peak_rss_bytes gauge\n")
+            process: str
+            rss: int
+            for process, rss in peak_rss.items():
+                metrics_file.write(
+                    f'ccft_pymarkdown_peak_rss_bytes{{process="{process}"}} {rss}\n'
+                )
+
+        metrics_file.write("# EOF\n")
+
+    def write(self, metrics_file: "TextIO", metrics_format: MetricsFormat) -> None:
+        """Export all the collected metrics in the given format."""
+        if metrics_format is MetricsFormat.JSON:
+            self.write_json(metrics_file)
+            return
+
+        self.write_openmetrics(metrics_file)
+
+
+_active_metrics: Metrics | None = None
+
+
+def start_collecting_metrics() -> Metrics:
+    """Start recording metrics from all cleaning, restoring & scanning of files."""
+    global _active_metrics  # noqa: PLW0603
+
+    _active_metrics = Metrics()
+    return _active_metrics
+
+
+def stop_collecting_metrics() -> None:
+    """Stop recording metrics, so that recording becomes a no-op."""
+    global _active_metrics  # noqa: PLW0603
+
+    _active_metrics = None
+
+
+def increment_metric(counter: MetricsCounter, amount: int = 1) -> None:
+    """Add the given amount to the given counted quantity, if metrics are being collected."""
+    if _active_metrics is not None:
+        _active_metrics.increment(counter, amount)
+
+
+def record_failures(failures_by_rule: "Mapping[str, int]") -> None:
+    """Add the given number of failures for each rule ID, if metrics are being collected."""
+    if _active_metrics is not None:
+        _active_metrics.record_failures(failures_by_rule)
+
+
+@contextlib.contextmanager
+def time_phase(phase: str) -> "Iterator[None]":
+    """Add the time spent within the context to the given phase, if collecting metrics."""
+    metrics: Metrics | None = _active_metrics
+    if metrics is None:
+        yield
+        return
+
+    start_time: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_phase_time(phase, time.perf_counter() - start_time)
+
+
+def _iter_timed[T](iterable: "Iterable[T]", phase: str, metrics: Metrics) -> "Iterator[T]":
+    iterator: Iterator[T] = iter(iterable)
+
+    while True:
+        start_time: float = time.perf_counter()
+        try:
+            item: T = next(iterator)
+        except StopIteration:
+            metrics.add_phase_time(phase, time.perf_counter() - start_time)
+            return
+
+        metrics.add_phase_time(phase, time.perf_counter() - start_time)
+        yield item
+
+
+def time_iter[T](iterable: "Iterable[T]", phase: str) -> "Iterable[T]":
+    """Add the time spent producing each item to the given phase, if collecting metrics."""
+    if _active_metrics is None:
+        return iterable
+
+    return _iter_timed(iterable, phase, _active_metrics)
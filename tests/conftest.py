@@ -0,0 +1,31 @@
+"""Shared pytest fixtures for the complete test suite of CCFT-PyMarkdown."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+
+__all__: "Sequence[str]" = ()
+
+
+@pytest.fixture()
+def create_files(tmp_path: "Path") -> "Callable[[Mapping[str, str]], Sequence[Path]]":
+    """Provide a function to write files with the given contents, relative to `tmp_path`."""
+
+    def _create_files(file_contents: "Mapping[str, str]") -> "Sequence[Path]":
+        file_paths: list[Path] = []
+
+        relative_file_path: str
+        contents: str
+        for relative_file_path, contents in file_contents.items():
+            file_path: Path = tmp_path / relative_file_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(contents)
+            file_paths.append(file_path)
+
+        return file_paths
+
+    return _create_files
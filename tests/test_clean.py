@@ -0,0 +1,130 @@
+"""Automated test suite for cleaning Markdown files within `_clean.py`."""
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ccft_pymarkdown import _clean, clean, restore
+from ccft_pymarkdown import _ownership as ownership
+from ccft_pymarkdown.utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+ORIGINAL_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| * 1 | 2 |\n"
+
+
+class TestTransactionalClean:
+    """Test case to unit-test that `clean` never leaves a batch of files partially cleaned."""
+
+    @classmethod
+    def _get_directory_contents(cls, root: "Path") -> "Mapping[str, str]":
+        return {child.name: child.read_text() for child in root.iterdir()}
+
+    def test_existing_original_files_reported_before_cleaning(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            dict.fromkeys(("first.md", "second.md", "third.md"), ORIGINAL_MARKDOWN)
+        )
+        FILES[1].with_name(f"{FILES[1].name}{CONVERSION_FILE_SUFFIX}").write_text("")
+        FILES[2].with_name(f"{FILES[2].name}{CONVERSION_FILE_SUFFIX}").write_text("")
+        ORIGINAL_CONTENTS: Final[Mapping[str, str]] = self._get_directory_contents(tmp_path)
+
+        with pytest.raises(FileExistsError, match=r"along with 1 other original files"):
+            clean(FILES, FileExclusionMethod.NOTHING)
+
+        assert self._get_directory_contents(tmp_path) == ORIGINAL_CONTENTS
+
+    def test_failed_write_restores_cleaned_files(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {
+                "first.md": ORIGINAL_MARKDOWN,
+                "second.md": f"{ORIGINAL_MARKDOWN}FAIL\n",
+                "third.md": ORIGINAL_MARKDOWN,
+            }
+        )
+        ORIGINAL_CONTENTS: Final[Mapping[str, str]] = self._get_directory_contents(tmp_path)
+
+        def _failing_clean_string(markdown: str) -> str:
+            if "FAIL" in markdown:
+                raise ValueError
+
+            return markdown.replace("| * ", "| ")
+
+        monkeypatch.setattr(_clean, "clean_string", _failing_clean_string)
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            clean(FILES, FileExclusionMethod.NOTHING)
+
+        assert self._get_directory_contents(tmp_path) == ORIGINAL_CONTENTS
+
+    def test_file_being_cleaned_by_another_owner_shared(
+        self,
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        FILE: Final[Path] = create_files({"table.md": ORIGINAL_MARKDOWN})[0]
+        ORIGINAL_FILE: Final[Path] = FILE.parent / f"{FILE.name}{CONVERSION_FILE_SUFFIX}"
+        FIRST_OWNER_ID: Final[str] = ownership.create_owner_id()
+        SECOND_OWNER_ID: Final[str] = ownership.create_owner_id()
+
+        preflight_checked: threading.Event = threading.Event()
+        ORIGINAL_PREFLIGHT_CHECK_FILES: Final = _clean._preflight_check_files  # noqa: SLF001
+
+        def _signalling_preflight_check_files(
+            files: "Sequence[Path]", *, dry_run: bool
+        ) -> None:
+            try:
+                ORIGINAL_PREFLIGHT_CHECK_FILES(files, dry_run=dry_run)
+            finally:
+                preflight_checked.set()
+
+        monkeypatch.setattr(
+            _clean, "_preflight_check_files", _signalling_preflight_check_files
+        )
+
+        second_owner_results: list[object] = []
+
+        def _clean_as_second_owner() -> None:
+            try:
+                second_owner_results.append(
+                    clean((FILE,), FileExclusionMethod.NOTHING, owner_id=SECOND_OWNER_ID)
+                )
+            except Exception as e:  # noqa: BLE001
+                second_owner_results.append(e)
+
+        # NOTE: The first owner has saved the original file, but not yet recorded itself as holding the file, when the second owner's preflight checks run
+        with ownership.lock_file(FILE):
+            _clean._clean_single_file(FILE)  # noqa: SLF001
+            CLEANED_MARKDOWN: Final[str] = FILE.read_text()
+
+            second_owner_thread: threading.Thread = threading.Thread(
+                target=_clean_as_second_owner
+            )
+            second_owner_thread.start()
+            assert preflight_checked.wait(timeout=10)
+
+            ownership.set_holders(FILE, (FIRST_OWNER_ID,))
+
+        second_owner_thread.join(timeout=10)
+
+        assert second_owner_results == [{FILE}]
+        assert FILE.read_text() == CLEANED_MARKDOWN
+
+        restore((ORIGINAL_FILE,), owner_id=FIRST_OWNER_ID)
+        assert FILE.read_text() == CLEANED_MARKDOWN
+
+        restore((ORIGINAL_FILE,), owner_id=SECOND_OWNER_ID)
+        assert FILE.read_text() == ORIGINAL_MARKDOWN
+        assert not ORIGINAL_FILE.exists()
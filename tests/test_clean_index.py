@@ -0,0 +1,106 @@
+"""Automated test suite for recording which files need cleaning within `_clean_index.py`."""
+
+import os
+from typing import TYPE_CHECKING
+
+from click.testing import CliRunner
+
+from ccft_pymarkdown import CleanIndex, clean, console, mirror_clean
+from ccft_pymarkdown.utils import FileExclusionMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+    from click.testing import Result as ClickResult
+
+__all__: "Sequence[str]" = ()
+
+TABLE_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| * 1 | 2 |\n"
+PLAIN_MARKDOWN: "Final[str]" = "# Title\n\nSome text here.\n"
+
+# NOTE: Recently modified files are never recorded, so each file is given an old modification time
+OLD_MODIFICATION_TIME_NS: "Final[int]" = 1_000_000_000_000_000_000
+
+
+class TestCleanIndex:
+    """Test case to unit-test classifying unchanged files using a persisted `CleanIndex`."""
+
+    def test_unchanged_files_classified_from_index(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        INDEX_FILE: Final[Path] = tmp_path / "index.json"
+        FILES: Final[Sequence[Path]] = create_files(
+            {"table.md": TABLE_MARKDOWN, "plain.md": PLAIN_MARKDOWN}
+        )
+        TABLE_FILE: Final[Path] = FILES[0]
+        PLAIN_FILE: Final[Path] = FILES[1]
+        os.utime(TABLE_FILE, ns=(OLD_MODIFICATION_TIME_NS, OLD_MODIFICATION_TIME_NS))
+        os.utime(PLAIN_FILE, ns=(OLD_MODIFICATION_TIME_NS, OLD_MODIFICATION_TIME_NS))
+
+        clean_index: CleanIndex = CleanIndex(INDEX_FILE)
+        assert clean_index.needs_cleaning(TABLE_FILE)
+        assert not clean_index.needs_cleaning(PLAIN_FILE)
+        clean_index.save()
+
+        # NOTE: Replacing the contents without changing the modification time or size proves the persisted index is used, rather than the file being read again
+        PLAIN_FILE.write_text(TABLE_MARKDOWN[: len(PLAIN_MARKDOWN)])
+        os.utime(PLAIN_FILE, ns=(OLD_MODIFICATION_TIME_NS, OLD_MODIFICATION_TIME_NS))
+
+        assert not CleanIndex(INDEX_FILE).needs_cleaning(PLAIN_FILE)
+
+    def test_clean_skips_files_without_tables(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {"table.md": TABLE_MARKDOWN, "plain.md": PLAIN_MARKDOWN}
+        )
+        TABLE_FILE: Final[Path] = FILES[0]
+        PLAIN_FILE: Final[Path] = FILES[1]
+        os.utime(TABLE_FILE, ns=(OLD_MODIFICATION_TIME_NS, OLD_MODIFICATION_TIME_NS))
+        os.utime(PLAIN_FILE, ns=(OLD_MODIFICATION_TIME_NS, OLD_MODIFICATION_TIME_NS))
+
+        assert clean(
+            (tmp_path,),
+            FileExclusionMethod.NOTHING,
+            clean_index=CleanIndex(tmp_path / "index.json"),
+        ) == {TABLE_FILE}
+        assert PLAIN_FILE.stat().st_mtime_ns == OLD_MODIFICATION_TIME_NS
+        assert not tmp_path.joinpath("plain.md.ccft-original").exists()
+
+    def test_index_not_saved_when_dry_run(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        INDEX_FILE: Final[Path] = tmp_path / "index.json"
+        FILES: Final[Sequence[Path]] = create_files(
+            {"table.md": TABLE_MARKDOWN, "plain.md": PLAIN_MARKDOWN}
+        )
+        file_path: Path
+        for file_path in FILES:
+            os.utime(file_path, ns=(OLD_MODIFICATION_TIME_NS, OLD_MODIFICATION_TIME_NS))
+
+        result: ClickResult = CliRunner().invoke(
+            console.run,
+            (
+                "clean",
+                "--dry-run",
+                "--clean-index",
+                str(INDEX_FILE),
+                *(str(file_path) for file_path in FILES),
+            ),
+        )
+
+        assert result.exit_code == 0, result.output
+        assert not INDEX_FILE.exists()
+        assert FILES[0].read_text() == TABLE_MARKDOWN
+
+        assert mirror_clean(
+            (tmp_path,),
+            tmp_path / "mirror",
+            FileExclusionMethod.NOTHING,
+            dry_run=True,
+            root=tmp_path,
+            clean_index=CleanIndex(INDEX_FILE),
+        ) == {FILES[0]}
+        assert not INDEX_FILE.exists()
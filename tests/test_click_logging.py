@@ -0,0 +1,74 @@
+"""Automated test suite for exporting log messages within `utils/click_logging.py`."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from click.testing import CliRunner
+
+from ccft_pymarkdown import console
+from ccft_pymarkdown.utils import click_logging
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+    from click.testing import Result as ClickResult
+
+__all__: "Sequence[str]" = ()
+
+TABLE_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| * 1 | 2 |\n"
+INVALID_MARKDOWN: "Final[str]" = "# Title\n# Title\n"
+
+
+class TestQueuedClickHandler:
+    """Test case to unit-test exporting log messages from the background writer thread."""
+
+    @classmethod
+    def _invoke(cls, args: "Sequence[str]", file_paths: "Sequence[Path]") -> "ClickResult":
+        return CliRunner().invoke(
+            console.run,
+            args,
+            input="\n".join(str(file_path) for file_path in file_paths),
+        )
+
+    @pytest.mark.parametrize(
+        ("args", "leftover_files", "expected_exit_code"),
+        (
+            (("-v", "clean", "--dry-run", "--files-from", "-"), {}, 0),
+            (("-v", "clean", "--files-from", "-"), {"table-05.md.ccft-original": ""}, 2),
+            (("-v", "scan-all", "--no-git", "--files-from", "-"), {}, 1),
+        ),
+    )
+    def test_output_matches_synchronous_handler(
+        self,
+        args: "Sequence[str]",
+        leftover_files: "Mapping[str, str]",
+        expected_exit_code: int,
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {
+                **{f"table-{index:02d}.md": TABLE_MARKDOWN for index in range(20)},
+                "invalid.md": INVALID_MARKDOWN,
+            }
+        )
+        create_files(leftover_files)
+
+        queued_result: ClickResult = self._invoke(args, FILES)
+
+        # NOTE: Shutting down the background writer thread straight after starting it leaves logging set up with only the synchronous handler
+        def _setup_synchronous_logging(verbosity: int) -> None:
+            ORIGINAL_SETUP_LOGGING(verbosity)
+            click_logging.shutdown_logging()
+
+        ORIGINAL_SETUP_LOGGING: Final[Callable[[int], None]] = click_logging.setup_logging
+        monkeypatch.setattr(click_logging, "setup_logging", _setup_synchronous_logging)
+
+        synchronous_result: ClickResult = self._invoke(args, FILES)
+
+        assert queued_result.exit_code == expected_exit_code, queued_result.output
+        assert synchronous_result.exit_code == expected_exit_code
+        assert "DEBUG: " in queued_result.output
+        assert queued_result.output.splitlines() == synchronous_result.output.splitlines()
@@ -0,0 +1,115 @@
+"""Automated test suite for the `CleanCustomFormattedTables` context manager."""
+
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ccft_pymarkdown import CleanCustomFormattedTables
+from ccft_pymarkdown.utils import FileExclusionMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Final
+
+    import pytest
+
+__all__: "Sequence[str]" = ()
+
+TABLE_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| * 1 | 2 |\n"
+PLAIN_MARKDOWN: "Final[str]" = "# Title\n\nSome text.\n"
+
+
+class TestReusableContextManager:
+    """Test case to unit-test re-entering a reusable `CleanCustomFormattedTables`."""
+
+    def test_reentry_cleans_and_restores(self, tmp_path: "Path") -> None:
+        TABLE_FILE: Final[Path] = tmp_path / "table.md"
+        TABLE_FILE.write_text(TABLE_MARKDOWN)
+        PLAIN_FILE: Final[Path] = tmp_path / "plain.md"
+        PLAIN_FILE.write_text(PLAIN_MARKDOWN)
+
+        custom_formatted_tables_cleaner: CleanCustomFormattedTables = (
+            CleanCustomFormattedTables((tmp_path,), FileExclusionMethod.NOTHING, reusable=True)
+        )
+
+        for _ in range(2):
+            with custom_formatted_tables_cleaner:
+                assert custom_formatted_tables_cleaner.cleaned_files == {
+                    TABLE_FILE,
+                    PLAIN_FILE,
+                }
+                assert TABLE_FILE.read_text() != TABLE_MARKDOWN
+                assert tmp_path.joinpath("table.md.ccft-original").exists()
+                assert not tmp_path.joinpath("plain.md.ccft-original").exists()
+
+            assert TABLE_FILE.read_text() == TABLE_MARKDOWN
+            assert PLAIN_FILE.read_text() == PLAIN_MARKDOWN
+
+    def test_reentry_rechecks_changed_files(self, tmp_path: "Path") -> None:
+        FILE: Final[Path] = tmp_path / "notes.md"
+        FILE.write_text(PLAIN_MARKDOWN)
+
+        custom_formatted_tables_cleaner: CleanCustomFormattedTables = (
+            CleanCustomFormattedTables((FILE,), FileExclusionMethod.NOTHING, reusable=True)
+        )
+
+        with custom_formatted_tables_cleaner:
+            assert FILE.read_text() == PLAIN_MARKDOWN
+
+        FILE.write_text(TABLE_MARKDOWN)
+
+        with custom_formatted_tables_cleaner:
+            assert FILE.read_text() != TABLE_MARKDOWN
+
+        assert FILE.read_text() == TABLE_MARKDOWN
+
+
+class TestVerifyRestore:
+    """Test case to unit-test verifying restored files within `CleanCustomFormattedTables`."""
+
+    def test_restored_files_match(self, tmp_path: "Path") -> None:
+        FILE: Final[Path] = tmp_path / "table.md"
+        FILE.write_text(TABLE_MARKDOWN)
+
+        custom_formatted_tables_cleaner: CleanCustomFormattedTables
+        with CleanCustomFormattedTables(
+            (FILE,), FileExclusionMethod.NOTHING, verify_restore=True
+        ) as custom_formatted_tables_cleaner:
+            assert FILE.read_text() != TABLE_MARKDOWN
+
+        assert custom_formatted_tables_cleaner.mismatched_files == []
+
+    def test_changed_original_reported(self, tmp_path: "Path") -> None:
+        FILE: Final[Path] = tmp_path / "table.md"
+        FILE.write_text(TABLE_MARKDOWN)
+
+        custom_formatted_tables_cleaner: CleanCustomFormattedTables
+        with CleanCustomFormattedTables(
+            (FILE,), FileExclusionMethod.NOTHING, verify_restore=True
+        ) as custom_formatted_tables_cleaner:
+            tmp_path.joinpath("table.md.ccft-original").write_text(PLAIN_MARKDOWN)
+
+        assert custom_formatted_tables_cleaner.mismatched_files == [FILE]
+
+    def test_bad_original_copy_reported(
+        self, tmp_path: "Path", monkeypatch: "pytest.MonkeyPatch"
+    ) -> None:
+        FILE: Final[Path] = tmp_path / "table.md"
+        FILE.write_text(TABLE_MARKDOWN)
+
+        ORIGINAL_COPYSTAT: Final[Callable[[Path, Path], None]] = shutil.copystat
+
+        # NOTE: The saved original file is corrupted straight after being copied, as a bad copy would be
+        def _corrupting_copystat(source: "Path", destination: "Path") -> None:
+            ORIGINAL_COPYSTAT(source, destination)
+            Path(destination).write_text(TABLE_MARKDOWN[:-1])
+
+        monkeypatch.setattr(shutil, "copystat", _corrupting_copystat)
+
+        custom_formatted_tables_cleaner: CleanCustomFormattedTables
+        with CleanCustomFormattedTables(
+            (FILE,), FileExclusionMethod.NOTHING, verify_restore=True
+        ) as custom_formatted_tables_cleaner:
+            pass
+
+        assert custom_formatted_tables_cleaner.mismatched_files == [FILE]
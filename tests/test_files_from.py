@@ -0,0 +1,97 @@
+"""Automated test suite for reading streamed lists of file paths within `utils`."""
+
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+import pytest
+from click.testing import CliRunner
+
+from ccft_pymarkdown import console, utils
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from typing import Final
+
+    from click.testing import Result as ClickResult
+
+__all__: "Sequence[str]" = ()
+
+
+class _ShortReadStream(io.BytesIO):
+    """Stream that returns each of the given chunks from a separate read, like a slow pipe."""
+
+    def __init__(self, chunks: "Iterable[bytes]") -> None:
+        super().__init__()
+
+        self._chunks: list[bytes] = list(chunks)
+
+    @override
+    def read1(self, size: int | None = -1, /) -> bytes:
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class TestReadFilePaths:
+    """Test case to unit-test the `read_file_paths` function."""
+
+    @pytest.mark.parametrize(
+        "raw_file_paths",
+        (
+            b"a.md\nsub dir/b.md\n",
+            b"a.md\r\nsub dir/b.md",
+            b"a.md\0sub dir/b.md\0",
+            b"\na.md\n\nsub dir/b.md\n\n",
+        ),
+    )
+    def test_separators(self, raw_file_paths: bytes) -> None:
+        assert list(utils.read_file_paths(io.BytesIO(raw_file_paths))) == [
+            Path("a.md"),
+            Path("sub dir/b.md"),
+        ]
+
+    def test_paths_split_across_chunks(self) -> None:
+        FILE_PATHS: Final[Sequence[Path]] = [
+            Path(f"directory-{index}/file-{index}.md") for index in range(10_000)
+        ]
+
+        raw_file_paths: bytes = b"\0".join(bytes(file_path) for file_path in FILE_PATHS)
+        assert len(raw_file_paths) > utils.FILE_PATHS_CHUNK_SIZE
+
+        assert list(utils.read_file_paths(io.BytesIO(raw_file_paths))) == FILE_PATHS
+
+    @pytest.mark.parametrize(
+        "chunks",
+        (
+            (b"docs/a.md", b"\0b.md\0"),
+            (b"docs/", b"a.md", b"\nb.md\n"),
+            (b"docs/a.md\0", b"b.md"),
+        ),
+    )
+    def test_separator_chosen_after_short_reads(self, chunks: "Sequence[bytes]") -> None:
+        assert list(utils.read_file_paths(_ShortReadStream(chunks))) == [
+            Path("docs/a.md"),
+            Path("b.md"),
+        ]
+
+
+class TestConsoleFilesFrom:
+    """Test case to unit-test the `--files-from` option of the command-line interface."""
+
+    @pytest.mark.parametrize("extra_args", ((), ("--pipelined",)))
+    def test_listed_non_markdown_files_skipped(
+        self,
+        extra_args: "Sequence[str]",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {"README.md": "# Title\n\nSome text.\n", "notes.txt": "Not Markdown.\n"}
+        )
+
+        result: ClickResult = CliRunner().invoke(
+            console.run,
+            ("scan-all", "--files-from", "-", *extra_args),
+            input=b"\0".join(bytes(file_path) for file_path in FILES),
+        )
+
+        assert result.exit_code == 0, result.output
+        assert not FILES[0].with_name("README.md.ccft-original").exists()
@@ -0,0 +1,125 @@
+"""Automated test suite for reading Markdown files from git blobs within `_git_blobs.py`."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ccft_pymarkdown import utils
+from ccft_pymarkdown._git_blobs import GitBlobReader
+
+# NOTE: GitPython is only installed with the [git-python] extra
+pytest.importorskip("git")
+
+from git import Actor, Repo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+COMMITTED_MARKDOWN: "Final[str]" = "# Committed\n"
+STAGED_MARKDOWN: "Final[str]" = "# Staged\n"
+WORKING_TREE_MARKDOWN: "Final[str]" = "# Working tree\n"
+AUTHOR: "Final[Actor]" = Actor("Test Author", "author@example.com")
+
+
+class TestGitBlobReader:
+    """Test case to unit-test the `GitBlobReader` class."""
+
+    def test_staged_contents_read_instead_of_working_tree(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {"README.md": STAGED_MARKDOWN, "docs/guide.md": STAGED_MARKDOWN, "notes.txt": ""}
+        )
+        repo: Repo = Repo.init(tmp_path)
+        repo.index.add([str(file_path) for file_path in FILES])
+        repo.index.write()
+        FILES[0].write_text(WORKING_TREE_MARKDOWN)
+
+        git_blob_reader: GitBlobReader = GitBlobReader(root=tmp_path)
+        try:
+            assert sorted(git_blob_reader.markdown_files) == sorted(FILES[:2])
+            assert git_blob_reader.read(FILES[0]) == STAGED_MARKDOWN
+        finally:
+            git_blob_reader.close()
+
+        assert FILES[0].read_text() == WORKING_TREE_MARKDOWN
+
+    def test_committed_contents_read_from_rev(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILE: Final[Path] = create_files({"README.md": COMMITTED_MARKDOWN})[0]
+        repo: Repo = Repo.init(tmp_path)
+        repo.index.add([str(FILE)])
+        repo.index.commit("Initial commit", author=AUTHOR, committer=AUTHOR)
+
+        FILE.write_text(STAGED_MARKDOWN)
+        repo.index.add([str(FILE)])
+        repo.index.write()
+
+        git_blob_reader: GitBlobReader = GitBlobReader("HEAD", root=tmp_path)
+        try:
+            assert list(git_blob_reader.iter_read()) == [(FILE, COMMITTED_MARKDOWN)]
+        finally:
+            git_blob_reader.close()
+
+        with pytest.raises(ValueError, match=r"is not a valid revision"):
+            GitBlobReader("does-not-exist", root=tmp_path)
+
+    def test_listed_paths_normalised(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        FILE: Final[Path] = create_files({"project/docs/guide.md": STAGED_MARKDOWN})[0]
+        PROJECT_ROOT: Final[Path] = tmp_path / "project"
+        repo: Repo = Repo.init(PROJECT_ROOT)
+        repo.index.add([str(FILE)])
+        repo.index.write()
+
+        SYMLINKED_PROJECT_ROOT: Final[Path] = tmp_path / "symlinked-project"
+        SYMLINKED_PROJECT_ROOT.symlink_to(PROJECT_ROOT, target_is_directory=True)
+        monkeypatch.chdir(PROJECT_ROOT)
+
+        git_blob_reader: GitBlobReader = GitBlobReader(root=SYMLINKED_PROJECT_ROOT)
+        try:
+            assert list(
+                git_blob_reader.iter_read(
+                    (
+                        Path("docs/../docs/guide.md"),
+                        Path("./docs/guide.md"),
+                        FILE,
+                        SYMLINKED_PROJECT_ROOT / "docs" / "guide.md",
+                    )
+                )
+            ) == [(Path("docs/../docs/guide.md"), STAGED_MARKDOWN)]
+        finally:
+            git_blob_reader.close()
+
+    def test_project_root_located_from_subdirectory(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {"README.md": STAGED_MARKDOWN, "docs/guide.md": STAGED_MARKDOWN}
+        )
+        repo: Repo = Repo.init(tmp_path)
+        repo.index.add([str(file_path) for file_path in FILES])
+        repo.index.write()
+
+        monkeypatch.chdir(tmp_path / "docs")
+        utils.get_project_root.cache_clear()
+        try:
+            git_blob_reader: GitBlobReader = GitBlobReader()
+            try:
+                assert sorted(git_blob_reader.markdown_files) == sorted(FILES)
+            finally:
+                git_blob_reader.close()
+        finally:
+            utils.get_project_root.cache_clear()
@@ -0,0 +1,72 @@
+"""Automated test suite for the import-time cost of the `ccft_pymarkdown` package."""
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+
+class TestImportTime:
+    """Test case to ensure importing the package stays fast & free of heavy dependencies."""
+
+    HEAVY_MODULES: "Final[Sequence[str]]" = ("click", "git", "inflect", "pymarkdown")
+
+    # NOTE: Importing every dependency eagerly took roughly 330ms, so this budget is generous enough to not be flaky, whilst still catching any heavy import being reintroduced
+    IMPORT_TIME_BUDGET_MICROSECONDS: "Final[int]" = 100_000
+
+    @classmethod
+    def _import(cls, source: str, cwd: "Path") -> tuple["AbstractSet[str]", int]:
+        # NOTE: Modules imported lazily with `importlib.import_module()` are missing from the output of `-X importtime`, so the whole source is timed instead
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                (
+                    "import time\n"
+                    "start_time = time.perf_counter_ns()\n"
+                    f"{source}\n"
+                    "import_time = (time.perf_counter_ns() - start_time) // 1000\n"
+                    "import sys\n"
+                    "print(import_time, *sys.modules, sep='\\n')\n"
+                ),
+            ),
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        raw_import_time: str
+        imported_modules: Sequence[str]
+        raw_import_time, *imported_modules = result.stdout.splitlines()
+
+        return set(imported_modules), int(raw_import_time)
+
+    def test_library_import_is_lazy(self, tmp_path: "Path") -> None:
+        imported_modules: AbstractSet[str]
+        import_time: int
+        imported_modules, import_time = self._import(
+            "import ccft_pymarkdown\nccft_pymarkdown.clean", tmp_path
+        )
+
+        assert "ccft_pymarkdown._clean" in imported_modules
+        assert not any(
+            module_name.partition(".")[0] in self.HEAVY_MODULES
+            for module_name in imported_modules
+        )
+        assert import_time < self.IMPORT_TIME_BUDGET_MICROSECONDS
+
+    def test_console_import_defers_linting_dependencies(self, tmp_path: "Path") -> None:
+        imported_modules: AbstractSet[str]
+        imported_modules, _ = self._import("import ccft_pymarkdown.console", tmp_path)
+
+        assert "click" in imported_modules
+        assert "pymarkdown" not in imported_modules
+        assert "inflect" not in imported_modules
@@ -0,0 +1,54 @@
+"""Automated test suite for collecting & exporting run metrics within `utils/metrics.py`."""
+
+import io
+from typing import TYPE_CHECKING
+
+from ccft_pymarkdown import clean, restore
+from ccft_pymarkdown.utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod
+from ccft_pymarkdown.utils.metrics import (
+    Metrics,
+    MetricsCounter,
+    start_collecting_metrics,
+    stop_collecting_metrics,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+
+class TestMetrics:
+    """Test case to unit-test the collection & export of metrics."""
+
+    def test_clean_and_restore_recorded(self, tmp_path: "Path") -> None:
+        FILE: Final[Path] = tmp_path / "table.md"
+        FILE.write_text("| a | b |\n|---|---|\n| * 1 | 2 |\n| * 3 | 4 |\n")
+
+        collected_metrics: Metrics = start_collecting_metrics()
+        try:
+            clean((tmp_path,), FileExclusionMethod.NOTHING)
+            restore((tmp_path / f"{FILE.name}{CONVERSION_FILE_SUFFIX}",))
+        finally:
+            stop_collecting_metrics()
+
+        assert collected_metrics.counters[MetricsCounter.FILES_DISCOVERED] == 1
+        assert collected_metrics.counters[MetricsCounter.FILES_CLEANED] == 1
+        assert collected_metrics.counters[MetricsCounter.FILES_RESTORED] == 1
+        assert collected_metrics.counters[MetricsCounter.LINES_MODIFIED] == 2
+        assert set(collected_metrics.phase_times) == {"discover", "clean", "restore"}
+
+    def test_openmetrics_export(self) -> None:
+        collected_metrics: Metrics = Metrics()
+        collected_metrics.increment(MetricsCounter.FILES_CLEANED, 3)
+        collected_metrics.record_failures({"MD041": 2})
+
+        metrics_file: io.StringIO = io.StringIO()
+        collected_metrics.write_openmetrics(metrics_file)
+        METRICS_LINES: Final[Sequence[str]] = metrics_file.getvalue().splitlines()
+
+        assert "ccft_pymarkdown_files_cleaned_total 3" in METRICS_LINES
+        assert 'ccft_pymarkdown_failures_total{rule_id="MD041"} 2' in METRICS_LINES
+        assert METRICS_LINES[-1] == "# EOF"
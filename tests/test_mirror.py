@@ -0,0 +1,47 @@
+"""Automated test suite for cleaning into a mirror of the project within `_mirror.py`."""
+
+from typing import TYPE_CHECKING
+
+from ccft_pymarkdown import clean_string, mirror_clean
+from ccft_pymarkdown.utils import FileExclusionMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+TABLE_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| * 1 | 2 |\n"
+PLAIN_MARKDOWN: "Final[str]" = "# Title\n\nSome text.\n"
+
+
+class TestMirrorClean:
+    """Test case to unit-test the `mirror_clean` function."""
+
+    def test_working_tree_untouched(self, tmp_path: "Path") -> None:
+        ROOT: Final[Path] = tmp_path / "project"
+        OUTPUT_DIRECTORY: Final[Path] = tmp_path / "mirror"
+        ROOT.joinpath("docs").mkdir(parents=True)
+        TABLE_FILE: Final[Path] = ROOT / "docs" / "table.md"
+        TABLE_FILE.write_text(TABLE_MARKDOWN)
+        PLAIN_FILE: Final[Path] = ROOT / "plain.md"
+        PLAIN_FILE.write_text(PLAIN_MARKDOWN)
+
+        for _ in range(2):
+            assert mirror_clean(
+                (ROOT,), OUTPUT_DIRECTORY, FileExclusionMethod.NOTHING, root=ROOT
+            ) == {TABLE_FILE}
+
+        assert OUTPUT_DIRECTORY.joinpath("docs", "table.md").read_text() == clean_string(
+            TABLE_MARKDOWN
+        )
+        assert OUTPUT_DIRECTORY.joinpath("plain.md").read_text() == PLAIN_MARKDOWN
+        assert OUTPUT_DIRECTORY.joinpath("plain.md").samefile(PLAIN_FILE)
+
+        assert TABLE_FILE.read_text() == TABLE_MARKDOWN
+        assert sorted(child.name for child in ROOT.rglob("*")) == [
+            "docs",
+            "plain.md",
+            "table.md",
+        ]
@@ -0,0 +1,183 @@
+"""Automated test suite for sharing cleaned Markdown files between concurrent runs."""
+
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ccft_pymarkdown import _ownership as ownership
+from ccft_pymarkdown import clean, restore
+from ccft_pymarkdown._ownership import create_owner_id
+from ccft_pymarkdown.utils import (
+    CONVERSION_FILE_SUFFIX,
+    LOCK_FILE_SUFFIX,
+    FileExclusionMethod,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+ORIGINAL_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| 1 | 2 |\n"
+STALE_LOCK_TIME_NS: "Final[int]" = 1_000_000_000_000_000_000
+
+
+class TestSharedCleaning:
+    """Test case to unit-test cleaning the same files from multiple concurrent owners."""
+
+    def test_file_restored_after_last_owner(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILE: Final[Path] = create_files({"table.md": ORIGINAL_MARKDOWN})[0]
+        ORIGINAL_FILE: Final[Path] = FILE.parent / f"{FILE.name}{CONVERSION_FILE_SUFFIX}"
+        FIRST_OWNER_ID: Final[str] = create_owner_id()
+        SECOND_OWNER_ID: Final[str] = create_owner_id()
+
+        assert clean((FILE,), FileExclusionMethod.NOTHING, owner_id=FIRST_OWNER_ID) == {FILE}
+        CLEANED_MARKDOWN: Final[str] = FILE.read_text()
+        assert clean((FILE,), FileExclusionMethod.NOTHING, owner_id=SECOND_OWNER_ID) == {FILE}
+        assert FILE.read_text() == CLEANED_MARKDOWN
+
+        restore((ORIGINAL_FILE,), owner_id=FIRST_OWNER_ID)
+        assert FILE.read_text() == CLEANED_MARKDOWN
+        assert ORIGINAL_FILE.exists()
+
+        restore((ORIGINAL_FILE,), owner_id=SECOND_OWNER_ID)
+        assert FILE.read_text() == ORIGINAL_MARKDOWN
+        assert not ORIGINAL_FILE.exists()
+        assert sorted(child.name for child in tmp_path.iterdir()) == [FILE.name]
+
+    def test_clean_without_owner_rejects_held_file(
+        self, create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILE: Final[Path] = create_files({"table.md": ORIGINAL_MARKDOWN})[0]
+
+        clean((FILE,), FileExclusionMethod.NOTHING, owner_id=create_owner_id())
+
+        with pytest.raises(FileExistsError, match="in use by another running process"):
+            clean((FILE,), FileExclusionMethod.NOTHING)
+
+    def test_holder_on_another_host_assumed_running(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+    ) -> None:
+        FILE: Final[Path] = create_files({"table.md": ORIGINAL_MARKDOWN})[0]
+        ORIGINAL_FILE: Final[Path] = FILE.parent / f"{FILE.name}{CONVERSION_FILE_SUFFIX}"
+
+        # NOTE: No process on this host can have this process ID (it is above Linux's maximum), but it belongs to a separate host (or container), so it cannot be checked
+        OTHER_HOST_OWNER_ID: Final[str] = f"{'0' * 16}:{2**22 + 1}:1:other-host"
+        clean((FILE,), FileExclusionMethod.NOTHING, owner_id=OTHER_HOST_OWNER_ID)
+
+        assert clean((FILE,), FileExclusionMethod.NOTHING, owner_id=create_owner_id()) == {
+            FILE
+        }
+
+        assert restore((ORIGINAL_FILE,)) == set()
+        assert ORIGINAL_FILE.exists()
+
+        # NOTE: Files left held by a crashed run on another host can only be restored by force
+        assert restore((ORIGINAL_FILE,), force=True) == {ORIGINAL_FILE}
+        assert FILE.read_text() == ORIGINAL_MARKDOWN
+        assert sorted(child.name for child in tmp_path.iterdir()) == [FILE.name]
+
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"),
+        reason="Process start times can only be retrieved on Linux",
+    )
+    def test_holder_with_reused_process_id_not_running(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+    ) -> None:
+        FILE: Final[Path] = create_files({"table.md": ORIGINAL_MARKDOWN})[0]
+        ORIGINAL_FILE: Final[Path] = FILE.parent / f"{FILE.name}{CONVERSION_FILE_SUFFIX}"
+
+        # NOTE: This process's ID has been reused since the crashed run, which started at a different time
+        host_id: str
+        pid: str
+        host_id, pid, _, _ = create_owner_id().split(":")
+        clean((FILE,), FileExclusionMethod.NOTHING, owner_id=f"{host_id}:{pid}:0:crashed")
+
+        assert restore((ORIGINAL_FILE,)) == {ORIGINAL_FILE}
+        assert FILE.read_text() == ORIGINAL_MARKDOWN
+        assert sorted(child.name for child in tmp_path.iterdir()) == [FILE.name]
+
+
+class TestLockFile:
+    """Test case to unit-test removing stale per-file locks."""
+
+    def test_stale_lock_replaced(self, tmp_path: "Path") -> None:
+        FILE: Final[Path] = tmp_path / "table.md"
+        LOCK_FILE: Final[Path] = tmp_path / f"{FILE.name}{LOCK_FILE_SUFFIX}"
+        LOCK_FILE.write_text("0:lock\n")
+        os.utime(LOCK_FILE, ns=(STALE_LOCK_TIME_NS, STALE_LOCK_TIME_NS))
+
+        with ownership.lock_file(FILE):
+            assert LOCK_FILE.read_text() == f"{ownership._get_process_id()}:lock\n"  # noqa: SLF001
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Lock files are not locked on Windows")
+    def test_locked_lock_never_replaced(self, tmp_path: "Path") -> None:
+        FILE: Final[Path] = tmp_path / "table.md"
+        LOCK_FILE: Final[Path] = tmp_path / f"{FILE.name}{LOCK_FILE_SUFFIX}"
+        acquired_lock_events: list[str] = []
+
+        def _hold_lock(name: str, release_lock_event: threading.Event) -> None:
+            with ownership.lock_file(FILE):
+                acquired_lock_events.append(name)
+                release_lock_event.wait()
+
+        RELEASE_FIRST_LOCK_EVENT: Final[threading.Event] = threading.Event()
+        first_lock_thread: threading.Thread = threading.Thread(
+            target=_hold_lock, args=("first", RELEASE_FIRST_LOCK_EVENT)
+        )
+        first_lock_thread.start()
+        try:
+            while not acquired_lock_events:
+                time.sleep(0.01)
+
+            # NOTE: The lock's contents & age make it look stale, as would a lock held by a process within another PID namespace
+            LOCK_FILE.write_text("0:lock\n")
+            os.utime(LOCK_FILE, ns=(STALE_LOCK_TIME_NS, STALE_LOCK_TIME_NS))
+
+            RELEASE_SECOND_LOCK_EVENT: Final[threading.Event] = threading.Event()
+            RELEASE_SECOND_LOCK_EVENT.set()
+            second_lock_thread: threading.Thread = threading.Thread(
+                target=_hold_lock, args=("second", RELEASE_SECOND_LOCK_EVENT)
+            )
+            second_lock_thread.start()
+            second_lock_thread.join(timeout=0.2)
+
+            assert acquired_lock_events == ["first"]
+
+        finally:
+            RELEASE_FIRST_LOCK_EVENT.set()
+            first_lock_thread.join()
+
+        second_lock_thread.join()
+
+        assert acquired_lock_events == ["first", "second"]
+        assert list(tmp_path.iterdir()) == []
+
+    def test_new_lock_never_removed_as_stale(self, tmp_path: "Path") -> None:
+        LOCK_FILE: Final[Path] = tmp_path / f"table.md{LOCK_FILE_SUFFIX}"
+        LOCK_FILE.write_text("0:lock\n")
+        os.utime(LOCK_FILE, ns=(STALE_LOCK_TIME_NS, STALE_LOCK_TIME_NS))
+        STALE_LOCK_FILE_STAT: Final[os.stat_result] = LOCK_FILE.stat()
+
+        # NOTE: Another process removes the stale lock & creates its own, after this process found the lock to be stale
+        LOCK_FILE.unlink()
+        LOCK_FILE.write_text(f"{os.getpid()}:lock\n")
+
+        ownership._remove_stale_lock(LOCK_FILE, STALE_LOCK_FILE_STAT)  # noqa: SLF001
+
+        assert LOCK_FILE.read_text() == f"{os.getpid()}:lock\n"
+        assert list(tmp_path.iterdir()) == [LOCK_FILE]
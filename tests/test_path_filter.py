@@ -0,0 +1,111 @@
+"""Automated test suite for selecting files using glob patterns within `_path_filter.py`."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ccft_pymarkdown import PathFilter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+    from git import Actor, Repo
+
+__all__: "Sequence[str]" = ()
+
+ROOT: "Final[Path]" = Path("/project")
+MARKDOWN: "Final[str]" = "# Title\n"
+
+
+class TestPathFilter:
+    """Test case to unit-test the `PathFilter` class."""
+
+    @pytest.mark.parametrize(
+        ("exclude_patterns", "relative_file_path", "is_selected"),
+        (
+            (("vendor",), "vendor/README.md", False),
+            (("vendor",), "docs/vendor/README.md", False),
+            (("vendor",), "docs/vendored.md", True),
+            (("docs/_build/",), "docs/_build/html/index.md", False),
+            (("docs/_build/",), "other/docs/_build/index.md", True),
+            (("*.generated.md",), "docs/api.generated.md", False),
+            (("**/changelog?.md",), "a/b/changelog1.md", False),
+            (("notes/[!a]*.md",), "notes/apple.md", True),
+            (("notes/[!a]*.md",), "notes/banana.md", False),
+        ),
+    )
+    def test_exclude_patterns(
+        self,
+        exclude_patterns: "Sequence[str]",
+        relative_file_path: str,
+        *,
+        is_selected: bool,
+    ) -> None:
+        path_filter: PathFilter = PathFilter(exclude_patterns=exclude_patterns, root=ROOT)
+
+        assert path_filter.matches(ROOT / relative_file_path) is is_selected
+
+    def test_include_patterns(self) -> None:
+        path_filter: PathFilter = PathFilter(
+            include_patterns=("docs/", "README.md"), exclude_patterns=("_build",), root=ROOT
+        )
+
+        assert path_filter.matches(ROOT / "docs" / "guide" / "index.md")
+        assert path_filter.matches(ROOT / "src" / "README.md")
+        assert not path_filter.matches(ROOT / "src" / "notes.md")
+        assert not path_filter.matches(ROOT / "docs" / "_build" / "index.md")
+
+    def test_excluded_directories(self) -> None:
+        path_filter: PathFilter = PathFilter(exclude_patterns=("docs/_build",), root=ROOT)
+
+        assert path_filter.is_excluded_directory(ROOT / "docs" / "_build")
+        assert not path_filter.is_excluded_directory(ROOT / "docs")
+        assert not PathFilter(include_patterns=("docs",), root=ROOT).is_excluded_directory(
+            ROOT / "src"
+        )
+
+    def test_excluded_directories_pruned_when_reading_git_blobs(
+        self,
+        tmp_path: Path,
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # NOTE: GitPython is only installed with the [git-python] extra
+        git = pytest.importorskip("git")
+        from ccft_pymarkdown._git_blobs import GitBlobReader  # noqa: PLC0415
+
+        FILES: Final[Sequence[Path]] = create_files(
+            {
+                "README.md": MARKDOWN,
+                "vendor/README.md": MARKDOWN,
+                "vendor/nested/README.md": MARKDOWN,
+            }
+        )
+        AUTHOR: Final[Actor] = git.Actor("Test Author", "author@example.com")
+        repo: Repo = git.Repo.init(tmp_path)
+        repo.index.add([str(file_path) for file_path in FILES])
+        repo.index.commit("Initial commit", author=AUTHOR, committer=AUTHOR)
+
+        path_filter: PathFilter = PathFilter(exclude_patterns=("vendor",), root=tmp_path)
+
+        checked_file_paths: list[Path] = []
+        ORIGINAL_MATCHES: Final[Callable[[Path], bool]] = path_filter.matches
+
+        def _recording_matches(file_path: Path) -> bool:
+            checked_file_paths.append(file_path)
+            return ORIGINAL_MATCHES(file_path)
+
+        monkeypatch.setattr(path_filter, "matches", _recording_matches)
+
+        git_blob_reader: GitBlobReader = GitBlobReader(
+            "HEAD", root=tmp_path, path_filter=path_filter
+        )
+        try:
+            assert list(git_blob_reader.markdown_files) == [FILES[0]]
+        finally:
+            git_blob_reader.close()
+
+        # NOTE: Files within excluded directories are never checked, because those directories are never traversed
+        assert checked_file_paths == [FILES[0]]
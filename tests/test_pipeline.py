@@ -0,0 +1,128 @@
+"""Automated test suite for pipelined cleaning of Markdown files within `_pipeline.py`."""
+
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ccft_pymarkdown import _clean, pipelined_clean
+from ccft_pymarkdown.utils import CONVERSION_FILE_SUFFIX, FileExclusionMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+ORIGINAL_MARKDOWN: "Final[str]" = "| a | b |\n|---|---|\n| * 1 | 2 |\n"
+FILES_COUNT: "Final[int]" = 20
+
+
+class TestPipelinedClean:
+    """Test case to unit-test the `pipelined_clean` generator."""
+
+    @classmethod
+    def _get_directory_contents(cls, root: "Path") -> "Mapping[str, str]":
+        return {child.name: child.read_text() for child in root.iterdir()}
+
+    def test_pending_files_bounded(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {f"{index:02d}.md": ORIGINAL_MARKDOWN for index in range(FILES_COUNT)}
+        )
+        MAX_PENDING_FILES: Final[int] = 2
+
+        yielded_files: list[Path] = []
+
+        pipelined_cleaned_files: Generator[Path]
+        with contextlib.closing(
+            pipelined_clean(
+                FILES, FileExclusionMethod.NOTHING, max_pending_files=MAX_PENDING_FILES
+            )
+        ) as pipelined_cleaned_files:
+            file_path: Path
+            for file_path in pipelined_cleaned_files:
+                # NOTE: Waiting gives the cleaning thread time to clean as far ahead as it is allowed
+                time.sleep(0.05)
+
+                assert file_path.read_text() != ORIGINAL_MARKDOWN
+
+                # NOTE: Besides the queued files, one file is in use & one more is waiting to be queued
+                assert len(list(tmp_path.glob(f"*{CONVERSION_FILE_SUFFIX}"))) <= (
+                    MAX_PENDING_FILES + 2
+                )
+
+                yielded_files.append(file_path)
+
+        assert yielded_files == list(FILES)
+        assert self._get_directory_contents(tmp_path) == {
+            file_path.name: ORIGINAL_MARKDOWN for file_path in FILES
+        }
+
+    def test_unused_files_restored_when_closed(
+        self, tmp_path: "Path", create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {f"{index:02d}.md": ORIGINAL_MARKDOWN for index in range(FILES_COUNT)}
+        )
+
+        pipelined_cleaned_files: Generator[Path] = pipelined_clean(
+            FILES, FileExclusionMethod.NOTHING, max_pending_files=4
+        )
+
+        index: int
+        file_path: Path
+        for index, file_path in enumerate(pipelined_cleaned_files):
+            if index == 2:
+                break
+
+            assert file_path.read_text() != ORIGINAL_MARKDOWN
+
+        pipelined_cleaned_files.close()
+
+        assert self._get_directory_contents(tmp_path) == {
+            file_path.name: ORIGINAL_MARKDOWN for file_path in FILES
+        }
+
+    def test_cleaning_error_raised_without_modified_files(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {
+                f"{index:02d}.md": (
+                    f"{ORIGINAL_MARKDOWN}FAIL\n"
+                    if index == FILES_COUNT // 2
+                    else ORIGINAL_MARKDOWN
+                )
+                for index in range(FILES_COUNT)
+            }
+        )
+        ORIGINAL_CONTENTS: Final[Mapping[str, str]] = self._get_directory_contents(tmp_path)
+
+        def _failing_clean_string(markdown: str) -> str:
+            if "FAIL" in markdown:
+                raise ValueError
+
+            return markdown.replace("| * ", "| ")
+
+        monkeypatch.setattr(_clean, "clean_string", _failing_clean_string)
+
+        yielded_files: list[Path] = []
+
+        pipelined_cleaned_files: Generator[Path]
+        with (
+            pytest.raises(ValueError),  # noqa: PT011
+            contextlib.closing(
+                pipelined_clean(FILES, FileExclusionMethod.NOTHING, max_pending_files=4)
+            ) as pipelined_cleaned_files,
+        ):
+            yielded_files.extend(pipelined_cleaned_files)
+
+        assert yielded_files == list(FILES[: FILES_COUNT // 2])
+        assert self._get_directory_contents(tmp_path) == ORIGINAL_CONTENTS
@@ -0,0 +1,104 @@
+"""Automated test suite for scanning Markdown files within `_scan.py`."""
+
+import io
+import json
+from typing import TYPE_CHECKING
+
+from ccft_pymarkdown._scan import Scanner, create_pymarkdown_api
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final, TextIO
+
+    import pytest
+
+__all__: "Sequence[str]" = ()
+
+SCANNED_FILE_CONTENTS: "Final[Mapping[str, str]]" = {
+    "README.md": "# Title\n# Title\n",
+    "sub/README.md": "no heading\n",
+    "valid.md": "# Title\n\nSome text.\n",
+}
+
+
+class TestScanFilePaths:
+    """Test case to unit-test the batched `Scanner.scan_file_paths` method."""
+
+    @classmethod
+    def _get_errors(cls, scanner: Scanner) -> object:
+        results_file: io.StringIO = io.StringIO()
+        scanner.write_results(results_file)
+
+        raw_results: dict[str, object] = json.loads(results_file.getvalue())
+        del raw_results["file_costs"]
+        return raw_results
+
+    def test_batched_results_match_individual_results(
+        self, create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(SCANNED_FILE_CONTENTS)
+
+        batched_scanner: Scanner = Scanner(create_pymarkdown_api())
+        batched_scanner.scan_file_paths(FILES, batch_size=len(FILES))
+
+        individual_scanner: Scanner = Scanner(create_pymarkdown_api())
+        file_path: Path
+        for file_path in FILES:
+            individual_scanner.scan_file_path(file_path)
+
+        assert batched_scanner.encountered_failures
+        assert self._get_errors(batched_scanner) == self._get_errors(individual_scanner)
+        assert len(batched_scanner.file_costs) == len(FILES)
+
+    def test_fail_fast_stops_after_failing_batch(
+        self, create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(SCANNED_FILE_CONTENTS)
+
+        scanner: Scanner = Scanner(create_pymarkdown_api())
+        scanner.scan_file_paths(FILES, batch_size=1, fail_fast=True)
+
+        assert scanner.encountered_failures
+        assert len(scanner.file_costs) == 1
+
+
+class TestScanTimeout:
+    """Test case to unit-test killing & replacing the scanning process of a `Scanner`."""
+
+    def test_later_files_scanned_after_timeout(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+        capsys: "pytest.CaptureFixture[str]",
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(SCANNED_FILE_CONTENTS)
+
+        scanner: Scanner = Scanner(create_pymarkdown_api(), scan_timeout=1e-9)
+        try:
+            scanner.scan_file_path(FILES[2])
+
+            # NOTE: The timed-out scanning process is killed, so the next file is scanned within a new process
+            scanner.scan_timeout = 60
+            scanner.scan_file_path(FILES[0])
+        finally:
+            scanner.close()
+
+        FAILURE_COUNTS: Final[Mapping[str, int]] = scanner.get_failure_counts()
+        assert FAILURE_COUNTS["TIMEOUT"] == 1
+        assert FAILURE_COUNTS["MD025"] == 1
+
+        RESULTS_FILE: Final[Path] = tmp_path / "results.json"
+        results_file: TextIO
+        with RESULTS_FILE.open("w") as results_file:
+            scanner.write_results(results_file)
+
+        merging_scanner: Scanner = Scanner()
+        with RESULTS_FILE.open("r") as results_file:
+            merging_scanner.read_results(results_file)
+        merging_scanner.log_errors()
+
+        assert (
+            f"{FILES[2]}: TIMEOUT: Scanning took longer than 1e-09 seconds\n"
+            in capsys.readouterr().out
+        )
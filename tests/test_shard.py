@@ -0,0 +1,80 @@
+"""Automated test suite for splitting Markdown files into shards within `_shard.py`."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ccft_pymarkdown._shard import get_file_cost_key, select_shard
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ()
+
+
+class TestSelectShard:
+    """Test case to unit-test the `select_shard` function."""
+
+    def test_shards_contain_every_file_exactly_once(
+        self, create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {f"{index}.md": "a" * index * 10 for index in range(1, 20)}
+        )
+
+        shards: Sequence[Sequence[Path]] = [
+            select_shard(FILES, shard_index, 4) for shard_index in range(1, 5)
+        ]
+
+        assert sorted(file_path for shard in shards for file_path in shard) == sorted(FILES)
+
+    def test_shards_balanced_by_file_size(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {
+                "big.md": "a" * 100,
+                "medium.md": "a" * 60,
+                "small-1.md": "a" * 20,
+                "small-2.md": "a" * 20,
+            }
+        )
+
+        assert select_shard(FILES, 1, 2) == [tmp_path / "big.md"]
+        assert sorted(select_shard(FILES, 2, 2)) == sorted(
+            [tmp_path / "medium.md", tmp_path / "small-1.md", tmp_path / "small-2.md"]
+        )
+
+    def test_shards_balanced_by_recorded_costs(
+        self,
+        tmp_path: "Path",
+        create_files: "Callable[[Mapping[str, str]], Sequence[Path]]",
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {"slow.md": "a" * 10, "fast-1.md": "a" * 50, "fast-2.md": "a" * 50}
+        )
+        RECORDED_FILE_COSTS: Final[Mapping[str, float]] = {
+            get_file_cost_key(tmp_path / "slow.md"): 2.0,
+            get_file_cost_key(tmp_path / "fast-1.md"): 1.0,
+            get_file_cost_key(tmp_path / "fast-2.md"): 1.0,
+        }
+
+        assert select_shard(FILES, 1, 2, RECORDED_FILE_COSTS) == [tmp_path / "slow.md"]
+
+    def test_shards_are_deterministic(
+        self, create_files: "Callable[[Mapping[str, str]], Sequence[Path]]"
+    ) -> None:
+        FILES: Final[Sequence[Path]] = create_files(
+            {f"{index}.md": "a" * 10 for index in range(8)}
+        )
+
+        assert select_shard(FILES, 2, 3) == select_shard(reversed(FILES), 2, 3)
+
+    @pytest.mark.parametrize(("shard_index", "shard_count"), ((0, 2), (3, 2), (1, 0)))
+    def test_invalid_shard(self, shard_index: int, shard_count: int) -> None:
+        with pytest.raises(ValueError, match=r"Invalid shard"):
+            select_shard((), shard_index, shard_count)